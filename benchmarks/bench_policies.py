@@ -0,0 +1,240 @@
+import argparse
+import inspect
+import json
+import multiprocessing
+import os
+import platform
+import random
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+
+import numpy as np
+
+from cache.registry import POLICIES, policy_class
+from sim.trace_format import BINARY_SUFFIX, load_trace
+
+# Per-access cost of every registered policy on synthetic streams and the bundled traces.
+# Each (policy, source, capacity) case runs in a fresh process so its peak RSS is its own;
+# the timed replays run without tracemalloc, and one extra replay under tracemalloc
+# measures the bytes each access allocates, the traced peak and the blocks the cache
+# retains afterwards.
+STREAMS = ("sequential", "strided", "uniform", "zipf", "loop")
+CAPACITIES = [8, 64, 512, 4096, 65536]
+DEFAULT_LENGTH = 100000
+TRACE_DIR = "traces"
+BASELINE_DIR = "benchmarks/baselines"
+
+
+def synthetic_stream(kind, capacity, length, seed=0):
+    # Keys over a footprint of at least twice the capacity, so every stream also evicts
+    footprint = max(2 * capacity, 1024)
+    rng = np.random.default_rng(seed)
+    positions = np.arange(length, dtype=np.int64)
+    if kind == "sequential":
+        keys = positions  # Pure scan, never reused
+    elif kind == "strided":
+        keys = (positions * 64) % (footprint * 64)  # Line-sized stride, wrapping over the footprint
+    elif kind == "uniform":
+        keys = rng.integers(0, footprint, length)
+    elif kind == "zipf":
+        keys = (rng.zipf(1.2, length) - 1) % footprint
+    elif kind == "loop":
+        keys = positions % (capacity + capacity // 8 + 1)  # Just over capacity: LRU's worst case
+    else:
+        raise ValueError(f"Unknown stream: {kind}, expected one of {STREAMS}")
+    return keys.astype(np.int64).tolist()
+
+
+def bundled_traces(trace_dir=TRACE_DIR):
+    return sorted(os.path.join(trace_dir, name) for name in os.listdir(trace_dir)
+                  if not name.endswith(BINARY_SUFFIX) and not name.startswith("."))
+
+
+def load_stream(source, capacity, length):
+    # (keys, labels or None) for a synthetic stream name or a trace path
+    if source in STREAMS:
+        return synthetic_stream(source, capacity, length), None
+    labels, addresses = load_trace(source)
+    return addresses[:length].tolist(), labels[:length].tolist()
+
+
+def _peak_rss_kib():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak  # Bytes on macOS, KiB on Linux
+
+
+def _replay(cache, keys, labels):
+    if getattr(cache, "offline", False):
+        cache.run(np.asarray(keys, dtype=np.int64))
+        return
+    access = cache.access
+    if labels is not None and "access_type" in inspect.signature(access).parameters:
+        for label, key in zip(labels, keys):
+            access(key, access_type=label)
+    else:
+        for key in keys:
+            access(key)
+
+
+def _allocation_replay(cache, keys, labels):
+    # Replay under tracemalloc, resetting the peak around every access: the traced memory a
+    # call reaches above its starting size counts what it allocates, including objects freed
+    # before it returns or replacing the previous access's. Memory a call frees before it
+    # allocates offsets the later allocation, so this is a lower bound on bytes allocated.
+    # Returns (allocated bytes summed over accesses, overall traced peak).
+    get_traced_memory = tracemalloc.get_traced_memory
+    reset_peak = tracemalloc.reset_peak
+    if getattr(cache, "offline", False):
+        keys = np.asarray(keys, dtype=np.int64)
+        before, _ = get_traced_memory()
+        reset_peak()
+        cache.run(keys)
+        _, peak = get_traced_memory()
+        return peak - before, peak
+    access = cache.access
+    typed = labels is not None and "access_type" in inspect.signature(access).parameters
+    allocated = 0
+    traced_peak = 0
+    for index, key in enumerate(keys):
+        before, _ = get_traced_memory()
+        reset_peak()
+        if typed:
+            access(key, access_type=labels[index])
+        else:
+            access(key)
+        _, peak = get_traced_memory()
+        allocated += peak - before
+        if peak > traced_peak:
+            traced_peak = peak
+    return allocated, traced_peak
+
+
+def run_case(case):
+    random.seed(0)
+    np.random.seed(0)
+    keys, labels = load_stream(case["source"], case["capacity"], case["length"])
+    cls = policy_class(case["policy"])
+    count = max(len(keys), 1)
+
+    best = None
+    for _ in range(case["repeat"]):
+        cache = cls(case["capacity"])
+        start = time.perf_counter_ns()
+        _replay(cache, keys, labels)
+        elapsed = time.perf_counter_ns() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    # Blocks still alive after the replay are the policy's retained metadata
+    cache = cls(case["capacity"])
+    tracemalloc.start()
+    allocated, traced_peak = _allocation_replay(cache, keys, labels)
+    retained_blocks = sum(stat.count for stat in tracemalloc.take_snapshot().statistics("filename"))
+    tracemalloc.stop()
+
+    return {
+        **{field: case[field] for field in ("policy", "source", "capacity", "length")},
+        "ns_per_access": best / count,
+        "accesses_per_sec": count / (best / 1e9) if best else 0.0,
+        "peak_rss_kib": _peak_rss_kib(),
+        "traced_peak_kib": traced_peak / 1024,
+        "allocated_bytes_per_access": allocated / count,
+        "retained_blocks_per_access": retained_blocks / count,
+        "miss_rate": cache.stats.miss_rate,
+    }
+
+
+def run_benchmarks(policies, sources, capacities, length=DEFAULT_LENGTH, repeat=3, workers=1, progress=True):
+    cases = [{"policy": policy, "source": source, "capacity": capacity, "length": length, "repeat": repeat}
+             for source in sources for capacity in capacities for policy in policies]
+    # One process per case (spawned, so no parent memory is inherited) keeps peak RSS per case
+    context = multiprocessing.get_context("spawn")
+    results = []
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context, max_tasks_per_child=1) as pool:
+        for done, row in enumerate(pool.map(run_case, cases), 1):
+            results.append(row)
+            if progress:
+                print(f"[{done}/{len(cases)}] {row['policy']:<11} {row['source']:<40} {row['capacity']:>6}: "
+                      f"{row['ns_per_access']:9.0f} ns/access {row['accesses_per_sec']:11.0f} acc/s "
+                      f"{row['peak_rss_kib']:7d} KiB RSS {row['allocated_bytes_per_access']:7.1f} B allocated/access "
+                      f"{row['retained_blocks_per_access']:6.3f} retained blocks/access")
+    return results
+
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def save_baseline(results, path=None):
+    commit = _git_commit()
+    created = datetime.now(timezone.utc)
+    if path is None:
+        path = os.path.join(BASELINE_DIR, f"{created:%Y%m%d-%H%M%S}-{commit or 'nogit'}.json")
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    payload = {
+        "created": created.isoformat(timespec="seconds"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "results": results,
+    }
+    with open(path, "w") as fp:
+        json.dump(payload, fp, indent=1)
+    return path
+
+
+def compare(results, baseline_path, threshold=0.1):
+    # Per-case ns/access ratio against a saved baseline; returns the regressed cases
+    with open(baseline_path) as fp:
+        baseline = json.load(fp)
+    previous = {(row["policy"], row["source"], row["capacity"], row["length"]): row for row in baseline["results"]}
+    regressions = []
+    print(f"Compared with {baseline_path} ({baseline.get('commit')}, {baseline.get('created')})")
+    for row in results:
+        old = previous.get((row["policy"], row["source"], row["capacity"], row["length"]))
+        if old is None:
+            continue
+        ratio = row["ns_per_access"] / old["ns_per_access"]
+        verdict = "slower" if ratio > 1 + threshold else "faster" if ratio < 1 - threshold else ""
+        if verdict == "slower":
+            regressions.append(row)
+        print(f"{row['policy']:<11} {row['source']:<40} {row['capacity']:>6}: "
+              f"{old['ns_per_access']:9.0f} -> {row['ns_per_access']:9.0f} ns/access ({ratio:5.2f}x) {verdict}")
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Per-access cost of every cache policy")
+    parser.add_argument("--policies", nargs="+", default=sorted(POLICIES), choices=sorted(POLICIES))
+    parser.add_argument("--sources", nargs="+", help=f"Streams {STREAMS} and/or trace paths (default: all streams and traces/)")
+    parser.add_argument("--capacities", nargs="+", type=int, help=f"Default: {CAPACITIES}")
+    parser.add_argument("--length", type=int, help=f"References per case (default: {DEFAULT_LENGTH})")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed replays per case (the fastest counts)")
+    parser.add_argument("-j", "--workers", type=int, default=1, help="Concurrent cases (more skews timings)")
+    parser.add_argument("--quick", action="store_true",
+                        help="Defaults to synthetic streams only, 3 capacities and 20k references")
+    parser.add_argument("--save", nargs="?", const="", help=f"Write a JSON baseline (default path under {BASELINE_DIR}/)")
+    parser.add_argument("--compare", help="Baseline JSON to compare ns/access against")
+    parser.add_argument("--threshold", type=float, default=0.1, help="Relative change reported as slower/faster")
+    args = parser.parse_args()
+
+    # --quick only shrinks what was not given explicitly
+    sources = args.sources or (list(STREAMS) if args.quick else list(STREAMS) + bundled_traces())
+    capacities = args.capacities or ([8, 512, 65536] if args.quick else CAPACITIES)
+    length = args.length or (20000 if args.quick else DEFAULT_LENGTH)
+
+    results = run_benchmarks(args.policies, sources, capacities, length, args.repeat, args.workers)
+    if args.save is not None:
+        print(f"Saved baseline to {save_baseline(results, args.save or None)}")
+    if args.compare and compare(results, args.compare, args.threshold):
+        sys.exit(1)
@@ -0,0 +1,4 @@
+# Replacement policies behind the Cache protocol. Policy modules are loaded lazily
+# through the registry, so importing the package stays cheap.
+from cache.protocol import Cache
+from cache.registry import POLICIES, STOCHASTIC_POLICIES, create, policy_class, register
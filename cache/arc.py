@@ -0,0 +1,108 @@
+from collections import OrderedDict
+
+from cache.stats import CacheStats
+
+
+class ARCCache:
+    # Adaptive Replacement Cache (Megiddo & Modha). T1 holds lines referenced once
+    # recently, T2 lines referenced at least twice; B1/B2 remember the keys recently
+    # evicted from each. Ghost hits move p, the target size of T1, towards whichever
+    # side would have hit. A hit is at most one OrderedDict move.
+    def __init__(self, capacity, verbose=False, log_every=0):
+        self.capacity = capacity
+        self.t1 = OrderedDict()  # key -> value, least recently used first
+        self.t2 = OrderedDict()
+        self.b1 = OrderedDict()  # Ghost keys evicted from T1, oldest first
+        self.b2 = OrderedDict()  # Ghost keys evicted from T2, oldest first
+        self.p = 0  # Target size of T1
+        self.verbose = verbose  # Return descriptive strings instead of a hit flag
+        self.stats = CacheStats(log_every=log_every or int(verbose))
+
+    @property
+    def miss_count(self):
+        return self.stats.misses
+
+    @property
+    def total_count(self):
+        return self.stats.accesses
+
+    def access(self, key, value=None):
+        if key in self.t1:
+            # Second reference: promote to the frequency side
+            self.t2[key] = self.t1.pop(key)
+            self.stats.hits += 1
+            if self.verbose:
+                return f"Cache hit: {key} -> {self.t2[key]}"
+            return True
+        if key in self.t2:
+            self.t2.move_to_end(key)
+            self.stats.hits += 1
+            if self.verbose:
+                return f"Cache hit: {key} -> {self.t2[key]}"
+            return True
+
+        # Cache miss
+        self.stats.misses += 1
+        if key in self.b1:
+            # Recency side would have hit: grow T1's target
+            self.p = min(self.capacity, self.p + max(len(self.b2) // len(self.b1), 1))
+            del self.b1[key]
+            self._make_room(False)
+            self.t2[key] = value
+        elif key in self.b2:
+            # Frequency side would have hit: shrink T1's target
+            self.p = max(0, self.p - max(len(self.b1) // len(self.b2), 1))
+            del self.b2[key]
+            self._make_room(True)
+            self.t2[key] = value
+        else:
+            # Keep |T1| + |B1| <= c and the whole directory <= 2c
+            recency_size = len(self.t1) + len(self.b1)
+            if recency_size >= self.capacity:
+                if len(self.t1) < self.capacity:
+                    self.b1.popitem(last=False)
+                    self._make_room(False)
+                else:
+                    evicted_key, evicted_value = self.t1.popitem(last=False)
+                    self.stats.record_eviction("ARC", evicted_key, evicted_value)
+            elif recency_size + len(self.t2) + len(self.b2) >= self.capacity:
+                if recency_size + len(self.t2) + len(self.b2) >= 2 * self.capacity and self.b2:
+                    self.b2.popitem(last=False)
+                self._make_room(False)
+            self.t1[key] = value
+
+        if self.verbose:
+            return f"Cache miss: Added {key} -> {value}"
+        return False
+
+    def _make_room(self, in_b2):
+        if len(self.t1) + len(self.t2) >= self.capacity:
+            self.evict(in_b2)
+
+    def evict(self, in_b2=False):
+        # ARC's REPLACE: take from T1 when it is over its target, otherwise from T2
+        t1_size = len(self.t1)
+        if self.t1 and (t1_size > self.p or (in_b2 and t1_size == self.p) or not self.t2):
+            key, value = self.t1.popitem(last=False)
+            self.b1[key] = None
+        else:
+            key, value = self.t2.popitem(last=False)
+            self.b2[key] = None
+        self.stats.record_eviction("ARC", key, value)
+        return key, value
+
+    def __contains__(self, key):
+        return key in self.t1 or key in self.t2
+
+    def invalidate(self, key):
+        # Drop a resident line without counting an eviction (e.g. back-invalidation)
+        if key in self.t1:
+            del self.t1[key]
+            return True
+        if key in self.t2:
+            del self.t2[key]
+            return True
+        return False
+
+    def display(self):
+        return list(self.t1.items()) + list(self.t2.items())
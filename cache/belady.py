@@ -0,0 +1,135 @@
+import sys
+from heapq import heapify, heappop, heappush
+
+import numpy as np
+
+from cache.stats import CacheStats
+from sim.trace_format import load_trace
+
+# Belady's MIN / OPT: on a miss in a full cache, evict the resident line whose next
+# reference lies furthest in the future. Needs the whole trace up front, so it is an
+# offline lower bound for every online policy, and its hit/miss decisions double as
+# supervised labels for the learned policies.
+NEVER = np.iinfo(np.int64).max  # Next use recorded for last references
+
+
+def next_use(addresses):
+    # Index of the next reference to the same address, NEVER if none (vectorized)
+    addresses = np.asarray(addresses)
+    order = np.argsort(addresses, kind="stable")
+    ordered = addresses[order]
+    same = ordered[1:] == ordered[:-1]
+    following = np.full(len(addresses), NEVER, dtype=np.int64)
+    following[order[:-1][same]] = order[1:][same]
+    return following
+
+
+def opt_hits(addresses, capacity, sets=None, next_uses=None):
+    # Boolean hit mask of Belady's MIN. `sets` (one index per reference) runs an
+    # independent MIN per set with `capacity` ways; keys must then be unique across sets
+    # (line addresses are). Each set keeps a max-heap on next use with lazy deletion:
+    # entries are pushed on every reference and skipped at eviction once stale.
+    if capacity <= 0:
+        raise ValueError(f"capacity must be positive, got {capacity}")
+    if next_uses is None:
+        next_uses = next_use(addresses)
+    keys = np.asarray(addresses).tolist()
+    following = next_uses.tolist()
+    if sets is None:
+        set_ids = [0] * len(keys)
+        num_sets = 1
+    else:
+        set_ids = np.asarray(sets).tolist()
+        num_sets = max(set_ids, default=-1) + 1
+
+    heaps = [[] for _ in range(num_sets)]
+    occupancy = [0] * num_sets
+    resident = {}  # key -> next use of its latest reference
+    compact_at = 2 * capacity + 64  # Rebuild a heap once stale entries dominate it
+    hit_positions = []
+
+    for i, (key, upcoming, set_index) in enumerate(zip(keys, following, set_ids)):
+        heap = heaps[set_index]
+        if key in resident:
+            hit_positions.append(i)
+        elif occupancy[set_index] >= capacity:
+            while True:
+                negated, victim = heappop(heap)
+                if resident.get(victim) == -negated:
+                    break
+            del resident[victim]
+        else:
+            occupancy[set_index] += 1
+        resident[key] = upcoming
+        heappush(heap, (-upcoming, key))
+        if len(heap) > compact_at:
+            heap[:] = [entry for entry in heap if resident.get(entry[1]) == -entry[0]]
+            heapify(heap)
+
+    hits = np.zeros(len(keys), dtype=bool)
+    hits[hit_positions] = True
+    return hits
+
+
+def opt_miss_counts(addresses, capacities):
+    # Optimal miss count per capacity; the next-use pass is shared by all of them
+    following = next_use(addresses)
+    return np.array([len(following) - int(np.count_nonzero(opt_hits(addresses, capacity, next_uses=following)))
+                     for capacity in capacities], dtype=np.int64)
+
+
+def opt_miss_ratio_curve(addresses, capacities):
+    # (capacities, optimal miss ratios), the lower envelope for stack_distance.miss_ratio_curve
+    capacities = np.asarray(capacities, dtype=np.int64)
+    return capacities, opt_miss_counts(addresses, capacities) / max(len(addresses), 1)
+
+
+class BeladyCache:
+    # Offline oracle wrapper so OPT can sit in sweeps next to the online policies.
+    # It needs the future, so it replays a whole trace with run() instead of access().
+    offline = True
+
+    def __init__(self, capacity, geometry=None):
+        self.capacity = capacity
+        self.geometry = geometry  # Set-associative OPT when given; capacity is then ignored
+        self.stats = CacheStats()
+
+    def run(self, addresses):
+        addresses = np.asarray(addresses)
+        if self.geometry is None:
+            keys, sets, ways = addresses, None, self.capacity
+        else:
+            sets, _ = self.geometry.split(addresses)
+            keys = addresses.astype(np.uint64) >> np.uint64(self.geometry.offset_bits)
+            ways = self.geometry.associativity
+        hits = opt_hits(keys, ways, sets)
+
+        # MIN never drops a line except to make room, so every miss beyond the
+        # first `ways` distinct lines of a set is an eviction
+        hit_count = int(np.count_nonzero(hits))
+        misses = len(hits) - hit_count
+        if sets is None:
+            fills = min(len(np.unique(keys)), ways)
+        else:
+            distinct = np.unique(keys)
+            per_set = np.bincount((distinct & np.uint64(self.geometry.set_mask)).astype(np.intp))
+            fills = int(np.minimum(per_set, ways).sum())
+        self.stats.hits += hit_count
+        self.stats.misses += misses
+        self.stats.evictions += misses - fills
+        return hits
+
+
+if __name__ == "__main__":
+    from sim.stack_distance import lru_miss_counts
+
+    trace_file = sys.argv[1] if len(sys.argv) > 1 else "traces/all_policy_trace"
+    capacities = [8, 16, 32, 64, 128, 256]
+    labels, addresses = load_trace(trace_file)
+    optimal = opt_miss_counts(addresses, capacities)
+    lru = lru_miss_counts(addresses, capacities)
+
+    print(f"{trace_file}")
+    for capacity, opt_count, lru_count in zip(capacities, optimal.tolist(), lru.tolist()):
+        print(f"Capacity {capacity}: OPT {opt_count} misses ({opt_count / len(addresses) * 100:.2f}%), "
+              f"LRU {lru_count} misses ({lru_count / len(addresses) * 100:.2f}%)")
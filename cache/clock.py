@@ -0,0 +1,99 @@
+from cache.stats import CacheStats
+
+_EMPTY = object()  # Marks a ring slot freed by invalidate()
+
+
+class ClockCache:
+    # CLOCK (second chance). Lines sit in a fixed ring of slots with a reference bit.
+    # A hit only sets the bit, so nothing moves. On a miss the hand sweeps forward,
+    # clearing set bits, and replaces the first line whose bit is already clear.
+    def __init__(self, capacity, verbose=False, log_every=0):
+        self.capacity = capacity
+        self.keys = []  # Ring of resident keys (or _EMPTY)
+        self.values = []
+        self.referenced = []
+        self.slots = {}  # key -> ring index
+        self.free = []  # Ring indices emptied by invalidate()
+        self.hand = 0
+        self.verbose = verbose  # Return descriptive strings instead of a hit flag
+        self.stats = CacheStats(log_every=log_every or int(verbose))
+
+    @property
+    def miss_count(self):
+        return self.stats.misses
+
+    @property
+    def total_count(self):
+        return self.stats.accesses
+
+    def access(self, key, value=None):
+        slot = self.slots.get(key)
+        if slot is not None:
+            self.referenced[slot] = True
+            self.stats.hits += 1
+            if self.verbose:
+                return f"Cache hit: {key} -> {self.values[slot]}"
+            return True
+
+        # Cache miss
+        self.stats.misses += 1
+        if len(self.slots) >= self.capacity:
+            self.evict()
+        if self.free:
+            slot = self.free.pop()
+            self.keys[slot] = key
+            self.values[slot] = value
+            self.referenced[slot] = False
+        else:
+            slot = len(self.keys)
+            self.keys.append(key)
+            self.values.append(value)
+            self.referenced.append(False)
+        self.slots[key] = slot
+
+        if self.verbose:
+            return f"Cache miss: Added {key} -> {value}"
+        return False
+
+    def evict(self):
+        keys = self.keys
+        referenced = self.referenced
+        size = len(keys)
+        hand = self.hand
+        while True:
+            slot = hand
+            hand = hand + 1 if hand + 1 < size else 0
+            if keys[slot] is _EMPTY:
+                continue
+            if referenced[slot]:
+                referenced[slot] = False  # Second chance
+                continue
+            break
+        self.hand = hand
+        key, value = keys[slot], self.values[slot]
+        self._free(slot)
+        self.stats.record_eviction("CLOCK", key, value)
+        return key, value
+
+    def _free(self, slot):
+        del self.slots[self.keys[slot]]
+        self.keys[slot] = _EMPTY
+        self.values[slot] = None
+        self.free.append(slot)
+
+    def __contains__(self, key):
+        return key in self.slots
+
+    def invalidate(self, key):
+        # Drop a resident line without counting an eviction (e.g. back-invalidation)
+        slot = self.slots.get(key)
+        if slot is None:
+            return False
+        self._free(slot)
+        return True
+
+    def display(self):
+        # Resident lines in sweep order, starting at the hand
+        size = len(self.keys)
+        order = [(self.hand + offset) % size for offset in range(size)]
+        return [(self.keys[slot], self.values[slot]) for slot in order if self.keys[slot] is not _EMPTY]
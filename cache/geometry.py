@@ -0,0 +1,140 @@
+import sys
+
+import numpy as np
+
+from cache.stats import CacheStats
+from cache.lru import LRUCache
+from sim.trace_format import load_trace
+
+
+def _log2(value, name):
+    if value <= 0 or value & (value - 1):
+        raise ValueError(f"{name} must be a positive power of two, got {value}")
+    return value.bit_length() - 1
+
+
+class CacheGeometry:
+    # Line size / sets / ways of a set-associative cache and the address split
+    #   | tag | set index (index_bits) | line offset (offset_bits) |
+    def __init__(self, line_size=64, num_sets=64, associativity=8):
+        self.line_size = line_size
+        self.num_sets = num_sets
+        self.associativity = associativity
+        self.offset_bits = _log2(line_size, "line_size")
+        self.index_bits = _log2(num_sets, "num_sets")
+        self.set_mask = num_sets - 1
+        if associativity <= 0:
+            raise ValueError(f"associativity must be positive, got {associativity}")
+
+    @classmethod
+    def from_size(cls, size_bytes, line_size=64, associativity=8):
+        num_sets = size_bytes // (line_size * associativity)
+        return cls(line_size, num_sets, associativity)
+
+    @property
+    def num_lines(self):
+        return self.num_sets * self.associativity
+
+    @property
+    def size_bytes(self):
+        return self.num_lines * self.line_size
+
+    def split(self, addresses):
+        # Vectorized (set index, tag) for an integer address array
+        blocks = np.asarray(addresses, dtype=np.uint64) >> np.uint64(self.offset_bits)
+        sets = (blocks & np.uint64(self.set_mask)).astype(np.intp)
+        tags = blocks >> np.uint64(self.index_bits)
+        return sets, tags
+
+    def locate(self, address):
+        # Scalar (set index, tag) for a single Python int address
+        block = address >> self.offset_bits
+        return block & self.set_mask, block >> self.index_bits
+
+    def line_address(self, set_index, tag):
+        return ((tag << self.index_bits) | set_index) << self.offset_bits
+
+    def __repr__(self):
+        return (f"CacheGeometry(line_size={self.line_size}, num_sets={self.num_sets}, "
+                f"associativity={self.associativity})")
+
+
+class SetAssociativeCache:
+    # Runs an independent replacement policy per set; any cache class taking a
+    # capacity works as the policy (LRUCache, FIFOCache, LFUCache, the adaptive caches).
+    def __init__(self, geometry, policy=LRUCache):
+        self.geometry = geometry
+        self.sets = [policy(geometry.associativity) for _ in range(geometry.num_sets)]
+        self.stats = CacheStats()
+
+    @property
+    def trained(self):
+        # False while any set still waits for fit() (e.g. an untrained HawkeyeCache)
+        return all(getattr(cache_set, "trained", True) for cache_set in self.sets)
+
+    def fit(self, labels, addresses):
+        # Train each set's policy on its own sub-trace of tags, at the set's capacity
+        # (associativity), so OPT-trained predictors learn per-set MIN decisions.
+        # Access types are dropped: run() replays bare addresses, and training on labels
+        # the sets never see at access time would hash to different signatures.
+        sets, tags = self.geometry.split(addresses)
+        order = np.argsort(sets, kind="stable")
+        bounds = np.searchsorted(sets[order], np.arange(self.geometry.num_sets + 1))
+        for set_index, cache_set in enumerate(self.sets):
+            cache_set.fit(None, tags[order[bounds[set_index]:bounds[set_index + 1]]])
+
+    def access(self, address, value=None):
+        set_index, tag = self.geometry.locate(address)
+        cache_set = self.sets[set_index]
+        evictions = cache_set.stats.evictions
+        if cache_set.access(tag, value):
+            self.stats.hits += 1
+            return True
+        self.stats.misses += 1
+        if cache_set.stats.evictions != evictions:
+            # Report the victim as a line address so callers can act on it
+            victim = self.geometry.line_address(set_index, cache_set.stats.last_evicted)
+            self.stats.record_eviction("set", victim)
+        return False
+
+    def __contains__(self, address):
+        set_index, tag = self.geometry.locate(address)
+        return tag in self.sets[set_index]
+
+    def invalidate(self, address):
+        set_index, tag = self.geometry.locate(address)
+        return self.sets[set_index].invalidate(tag)
+
+    def run(self, addresses):
+        # Replay an address array; returns a boolean hit mask aligned with the input
+        sets, tags = self.geometry.split(addresses)
+        hits = np.zeros(len(sets), dtype=bool)
+        cache_sets = self.sets
+        evictions = sum(cache_set.stats.evictions for cache_set in cache_sets)
+        for i, (set_index, tag) in enumerate(zip(sets.tolist(), tags.tolist())):
+            if cache_sets[set_index].access(tag):
+                hits[i] = True
+        hit_count = int(np.count_nonzero(hits))
+        self.stats.hits += hit_count
+        self.stats.misses += len(hits) - hit_count
+        self.stats.evictions += sum(cache_set.stats.evictions for cache_set in cache_sets) - evictions
+        return hits
+
+    def display(self):
+        return [(set_index, cache_set.display()) for set_index, cache_set in enumerate(self.sets)]
+
+
+if __name__ == "__main__":
+    trace_file = sys.argv[1] if len(sys.argv) > 1 else "traces/all_policy_trace"
+    labels, addresses = load_trace(trace_file)
+
+    print(f"{trace_file}")
+    for name, geometry in [
+        ("L1 32KiB 8-way", CacheGeometry.from_size(32 * 1024, 64, 8)),
+        ("L2 256KiB 8-way", CacheGeometry.from_size(256 * 1024, 64, 8)),
+        ("Fully associative 256 lines", CacheGeometry(64, 1, 256)),
+    ]:
+        cache = SetAssociativeCache(geometry)
+        cache.run(addresses)
+        print(f"{name}: {geometry}")
+        print(f"  Misses: {cache.stats.misses} ({cache.stats.miss_rate * 100:.2f}%)")
@@ -0,0 +1,248 @@
+import sys
+
+from cache.geometry import CacheGeometry, SetAssociativeCache
+from cache.lru import LRUCache
+from cache.stats import CacheStats
+from sim.trace_format import iter_addresses, load_trace
+
+# Dinero access-type labels
+READ, WRITE, IFETCH = 0, 1, 2
+INCLUSION_MODES = ("non-inclusive", "inclusive", "exclusive")
+
+
+class CacheLevel:
+    # One level of the hierarchy: a set-associative cache plus write policy and dirty lines
+    def __init__(self, name, geometry, policy=LRUCache, write_back=True, write_allocate=True):
+        self.name = name
+        self.geometry = geometry
+        self.cache = SetAssociativeCache(geometry, policy)
+        self.write_back = write_back  # False: write-through to the next level
+        self.write_allocate = write_allocate  # False: write misses bypass this level
+        self.dirty = set()  # Line addresses modified at this level (write-back only)
+        self.stats = CacheStats()  # Demand lookups that reached this level
+        self.writebacks = 0  # Dirty lines written to the next level on eviction
+        self.write_throughs = 0
+        self.back_invalidations = 0
+
+    def line(self, address):
+        return (address >> self.geometry.offset_bits) << self.geometry.offset_bits
+
+    def __contains__(self, address):
+        return address in self.cache
+
+    def fill(self, address):
+        # Install a line; returns the evicted line address or None
+        evictions = self.cache.stats.evictions
+        self.cache.access(address)
+        if self.cache.stats.evictions != evictions:
+            return self.cache.stats.last_evicted
+        return None
+
+    def lookup(self, address):
+        # Demand access that allocates on a miss; returns (hit, victim line or None)
+        if address in self.cache:
+            self.cache.access(address)
+            self.stats.hits += 1
+            return True, None
+        self.stats.misses += 1
+        return False, self.fill(address)
+
+    def probe(self, address):
+        # Demand lookup without allocation (exclusive lower levels)
+        if address in self.cache:
+            self.stats.hits += 1
+            return True
+        self.stats.misses += 1
+        return False
+
+    def invalidate(self, address):
+        # Remove a line; returns True if it was dirty here
+        line = self.line(address)
+        if self.cache.invalidate(address) and line in self.dirty:
+            self.dirty.discard(line)
+            return True
+        return False
+
+    def summary(self):
+        return {
+            "level": self.name,
+            **self.stats.as_dict(),
+            "evictions": self.cache.stats.evictions,
+            "writebacks": self.writebacks,
+            "write_throughs": self.write_throughs,
+            "back_invalidations": self.back_invalidations,
+        }
+
+
+class CacheHierarchy:
+    # Split L1I/L1D, unified L2 and an optional LLC. Only references that miss at a
+    # level travel to the next one, so deeper levels see a much smaller stream.
+    def __init__(self, l1i, l1d, l2, llc=None, inclusion="non-inclusive"):
+        if inclusion not in INCLUSION_MODES:
+            raise ValueError(f"inclusion must be one of {INCLUSION_MODES}, got {inclusion!r}")
+        self.l1i = l1i
+        self.l1d = l1d
+        self.l2 = l2
+        self.llc = llc
+        self.inclusion = inclusion
+        lower = [l2] + ([llc] if llc is not None else [])
+        self.instruction_path = [l1i] + lower
+        self.data_path = [l1d] + lower
+        self.levels = [l1i, l1d] + lower
+        # Levels whose contents must stay a subset of each lower level (inclusive mode)
+        self.upper_levels = {l2.name: [l1i, l1d]}
+        if llc is not None:
+            self.upper_levels[llc.name] = [l1i, l1d, l2]
+        if len({level.geometry.line_size for level in self.levels}) != 1:
+            raise ValueError("all levels must share the same line size")
+        if inclusion == "exclusive":
+            # Write-through or non-allocating writes would put a copy of the line in a lower
+            # level, breaking exclusivity; dirty state travels with the line instead
+            plain = [level.name for level in self.levels if not (level.write_back and level.write_allocate)]
+            if plain:
+                raise ValueError(f"exclusive hierarchies need write-back, write-allocate levels: {', '.join(plain)}")
+        self.memory_reads = 0
+        self.memory_writes = 0
+
+    def access(self, address, access_type=READ):
+        path = self.instruction_path if access_type == IFETCH else self.data_path
+        # Returns the depth that served the reference (0 = L1) or None for memory
+        if self.inclusion == "exclusive":
+            return self._access_exclusive(path, address, access_type == WRITE)
+        return self._access_allocating(path, address, access_type == WRITE)
+
+    def run(self, labels, addresses):
+        for label, address in zip(iter_addresses(labels), iter_addresses(addresses)):
+            self.access(address, label)
+
+    def _access_allocating(self, path, address, is_write):
+        # Inclusive / non-inclusive: every level that misses allocates the line
+        first = path[0]
+        if is_write and not first.write_allocate and address not in first:
+            # Write miss without allocation: the write itself goes down a level
+            first.stats.misses += 1
+            self._write_line(path, 1, first.line(address))
+            return None
+
+        for depth, level in enumerate(path):
+            hit, victim = level.lookup(address)
+            if victim is not None:
+                self._evicted(path, depth, victim)
+            if hit:
+                break
+        else:
+            depth = None
+            self.memory_reads += 1
+
+        if is_write:
+            line = first.line(address)
+            if first.write_back:
+                first.dirty.add(line)
+            else:
+                first.write_throughs += 1
+                self._write_line(path, 1, line)
+        return depth
+
+    def _access_exclusive(self, path, address, is_write):
+        # Exclusive: a line lives in exactly one level; lower levels act as victim caches.
+        # Every level is write-back/write-allocate (checked in __init__).
+        first = path[0]
+        hit, victim = first.lookup(address)
+        if is_write:
+            first.dirty.add(first.line(address))
+        depth = 0 if hit else None
+        if not hit:
+            for lower_depth in range(1, len(path)):
+                level = path[lower_depth]
+                if level.probe(address):
+                    # Promote the line into L1, carrying its dirty state along
+                    if level.invalidate(address):
+                        first.dirty.add(first.line(address))
+                    depth = lower_depth
+                    break
+            else:
+                self.memory_reads += 1
+        if victim is not None:
+            self._evicted(path, 0, victim)
+        return depth
+
+    def _write_line(self, path, depth, line):
+        # Deliver a write-through or write-back of `line` to path[depth] (memory past the end)
+        if depth >= len(path):
+            self.memory_writes += 1
+            return
+        level = path[depth]
+        if line in level or level.write_allocate:
+            victim = level.fill(line)
+            if victim is not None:
+                self._evicted(path, depth, victim)
+            if level.write_back:
+                level.dirty.add(line)
+                return
+            level.write_throughs += 1
+        self._write_line(path, depth + 1, line)
+
+    def _evicted(self, path, depth, victim):
+        level = path[depth]
+        dirty = victim in level.dirty
+        if dirty:
+            level.dirty.discard(victim)
+
+        if self.inclusion == "exclusive":
+            # The victim moves down one level instead of being dropped
+            if depth + 1 < len(path):
+                lower = path[depth + 1]
+                lower_victim = lower.fill(victim)
+                if dirty:
+                    lower.dirty.add(victim)
+                if lower_victim is not None:
+                    self._evicted(path, depth + 1, lower_victim)
+            elif dirty:
+                level.writebacks += 1
+                self.memory_writes += 1
+            return
+
+        if dirty:
+            level.writebacks += 1
+            self._write_line(path, depth + 1, victim)
+
+        if self.inclusion == "inclusive":
+            # Back-invalidate the line from every level above the evicting one
+            for upper in self.upper_levels.get(level.name, ()):
+                if victim in upper:
+                    upper.back_invalidations += 1
+                    if upper.invalidate(victim):
+                        # The dirty copy goes below the evicting level, like its own write-back
+                        upper.writebacks += 1
+                        self._write_line(path, depth + 1, victim)
+
+    def report(self):
+        for level in self.levels:
+            summary = level.summary()
+            print(f"{summary['level']}: {summary['accesses']} accesses, {summary['misses']} misses "
+                  f"({summary['miss_rate'] * 100:.2f}%), {summary['evictions']} evictions, "
+                  f"{summary['writebacks']} writebacks, {summary['back_invalidations']} back-invalidations")
+        print(f"Memory: {self.memory_reads} reads, {self.memory_writes} writes")
+
+
+def default_hierarchy(policy=LRUCache, llc_policy=None, inclusion="non-inclusive"):
+    # 32 KiB 8-way L1I/L1D, 256 KiB 8-way L2, 2 MiB 16-way LLC, 64-byte lines
+    return CacheHierarchy(
+        CacheLevel("L1I", CacheGeometry.from_size(32 * 1024, 64, 8), policy),
+        CacheLevel("L1D", CacheGeometry.from_size(32 * 1024, 64, 8), policy),
+        CacheLevel("L2", CacheGeometry.from_size(256 * 1024, 64, 8), policy),
+        CacheLevel("LLC", CacheGeometry.from_size(2 * 1024 * 1024, 64, 16), llc_policy or policy),
+        inclusion=inclusion,
+    )
+
+
+if __name__ == "__main__":
+    trace_file = sys.argv[1] if len(sys.argv) > 1 else "traces/all_policy_trace"
+    inclusion = sys.argv[2] if len(sys.argv) > 2 else "non-inclusive"
+    labels, addresses = load_trace(trace_file)
+
+    hierarchy = default_hierarchy(inclusion=inclusion)
+    hierarchy.run(labels, addresses)
+
+    print(f"{trace_file} ({inclusion})")
+    hierarchy.report()
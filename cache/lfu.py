@@ -0,0 +1,57 @@
+from cache.stats import CacheStats
+from cache.lfu_engine import LFUTracker
+
+
+class LFUCache:
+    def __init__(self, capacity, verbose=False, log_every=0):
+        self.capacity = capacity
+        self.cache = {}  # Stores the key-value pairs
+        self.lfu = LFUTracker()  # O(1) frequency buckets with FIFO tie-breaking
+        self.verbose = verbose  # Return descriptive strings instead of a hit flag
+        self.stats = CacheStats(log_every=log_every or int(verbose))
+
+    @property
+    def miss_count(self):
+        return self.stats.misses
+
+    @property
+    def total_count(self):
+        return self.stats.accesses
+
+    def access(self, key, value=None):
+        if key in self.cache:
+            self.lfu.touch(key)
+            self.stats.hits += 1
+            if self.verbose:
+                return f"Cache hit: {key} -> {self.cache[key]}"
+            return True
+
+        # Cache miss
+        self.stats.misses += 1
+        if len(self.cache) >= self.capacity:
+            # Evict the least frequently used key
+            evict_key = self.lfu.evict()
+            evict_value = self.cache.pop(evict_key)
+            self.stats.record_eviction("LFU", evict_key, evict_value)
+
+        # Add new key-value pair
+        self.cache[key] = value
+        self.lfu.insert(key)
+
+        if self.verbose:
+            return f"Cache miss: Added {key} -> {value}"
+        return False
+
+    def __contains__(self, key):
+        return key in self.cache
+
+    def invalidate(self, key):
+        # Drop a resident line without counting an eviction (e.g. back-invalidation)
+        if key in self.cache:
+            del self.cache[key]
+            self.lfu.remove(key)
+            return True
+        return False
+
+    def display(self):
+        return [(key, self.cache[key], self.lfu.frequency(key)) for key in self.cache]
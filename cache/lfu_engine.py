@@ -0,0 +1,113 @@
+from collections import OrderedDict
+
+
+class _Bucket:
+    # One frequency in the bucket list: its keys (oldest first) and its neighbours
+    __slots__ = ("freq", "keys", "prev", "next")
+
+    def __init__(self, freq, prev, next):
+        self.freq = freq
+        self.keys = OrderedDict()
+        self.prev = prev
+        self.next = next
+
+
+class LFUTracker:
+    # Constant-time LFU metadata shared by every LFU user.
+    # Non-empty frequency buckets form a doubly linked list in increasing frequency, so the
+    # head is always the minimum and removing or bumping a key never searches for it. Each
+    # bucket's keys are an OrderedDict so ties at the minimum are broken FIFO by arrival.
+    def __init__(self):
+        self.bucket_of = {}  # key -> _Bucket holding it
+        self.head = None  # Lowest-frequency bucket
+
+    def __len__(self):
+        return len(self.bucket_of)
+
+    def __contains__(self, key):
+        return key in self.bucket_of
+
+    def __iter__(self):
+        return iter(self.bucket_of)
+
+    @property
+    def min_freq(self):
+        return self.head.freq if self.head is not None else 0
+
+    def frequency(self, key):
+        bucket = self.bucket_of.get(key)
+        return bucket.freq if bucket is not None else 0
+
+    def _bucket_after(self, prev, freq):
+        # Bucket for `freq` directly after `prev` (None: at the head), created if missing
+        following = self.head if prev is None else prev.next
+        if following is not None and following.freq == freq:
+            return following
+        bucket = _Bucket(freq, prev, following)
+        if prev is None:
+            self.head = bucket
+        else:
+            prev.next = bucket
+        if following is not None:
+            following.prev = bucket
+        return bucket
+
+    def _unlink(self, bucket):
+        if bucket.prev is None:
+            self.head = bucket.next
+        else:
+            bucket.prev.next = bucket.next
+        if bucket.next is not None:
+            bucket.next.prev = bucket.prev
+
+    def insert(self, key, freq=1):
+        if key in self.bucket_of:
+            self.remove(key)
+        # New keys start at the head; a larger starting frequency walks to its place
+        bucket = self.head
+        if bucket is None or bucket.freq != freq:
+            prev = None
+            while bucket is not None and bucket.freq < freq:
+                prev, bucket = bucket, bucket.next
+            bucket = self._bucket_after(prev, freq)
+        bucket.keys[key] = None
+        self.bucket_of[key] = bucket
+
+    def touch(self, key):
+        # Bump the frequency of a resident key into the next bucket up
+        bucket = self.bucket_of[key]
+        del bucket.keys[key]
+        target = bucket.next
+        if target is None or target.freq != bucket.freq + 1:
+            target = self._bucket_after(bucket, bucket.freq + 1)
+        target.keys[key] = None
+        self.bucket_of[key] = target
+        if not bucket.keys:
+            self._unlink(bucket)
+        return target.freq
+
+    def victim(self):
+        # Least frequently used key (oldest among ties) without removing it
+        if self.head is None:
+            return None
+        return next(iter(self.head.keys))
+
+    def evict(self):
+        bucket = self.head
+        if bucket is None:
+            raise KeyError("evict from an empty LFUTracker")
+        key, _ = bucket.keys.popitem(last=False)
+        if not bucket.keys:
+            self._unlink(bucket)
+        del self.bucket_of[key]
+        return key
+
+    def remove(self, key):
+        bucket = self.bucket_of.pop(key)
+        del bucket.keys[key]
+        if not bucket.keys:
+            self._unlink(bucket)
+
+    def clear(self):
+        self.bucket_of.clear()
+        self.head = None
@@ -0,0 +1,137 @@
+from collections import OrderedDict
+
+from cache.stats import CacheStats
+
+
+class LIRSCache:
+    # LIRS (Jiang & Zhang). Lines with a low inter-reference recency (LIR) hold most of
+    # the cache. The rest (HIR) stay resident only briefly, in queue Q. Stack S orders
+    # recently seen keys, including non-resident HIR keys, and a key reused while still
+    # in S is promoted to LIR. S is pruned so its bottom is always a LIR key.
+    def __init__(self, capacity, hir_ratio=0.01, max_nonresident=None, verbose=False, log_every=0):
+        self.capacity = capacity
+        self.hir_size = max(1, int(capacity * hir_ratio))
+        self.lir_size = max(0, capacity - self.hir_size)
+        self.max_nonresident = max_nonresident or 2 * capacity  # Bound on ghost keys in S
+        self.values = {}  # Resident key -> value
+        self.lir = set()
+        self.stack = OrderedDict()  # S: key -> None, bottom (oldest) first
+        self.queue = OrderedDict()  # Q: resident HIR keys, next eviction first
+        self.nonresident = OrderedDict()  # Non-resident HIR keys still in S, oldest first
+        self.verbose = verbose  # Return descriptive strings instead of a hit flag
+        self.stats = CacheStats(log_every=log_every or int(verbose))
+
+    @property
+    def miss_count(self):
+        return self.stats.misses
+
+    @property
+    def total_count(self):
+        return self.stats.accesses
+
+    def access(self, key, value=None):
+        if key in self.lir:
+            self.stack.move_to_end(key)
+            self._prune()
+            self.stats.hits += 1
+            if self.verbose:
+                return f"Cache hit: {key} -> {self.values[key]}"
+            return True
+        if key in self.values:
+            # Resident HIR line
+            if key in self.stack:
+                self._promote(key)
+            else:
+                self.stack[key] = None
+                self.queue.move_to_end(key)
+            self.stats.hits += 1
+            if self.verbose:
+                return f"Cache hit: {key} -> {self.values[key]}"
+            return True
+
+        # Cache miss
+        self.stats.misses += 1
+        if len(self.values) >= self.capacity:
+            self.evict()
+        self.values[key] = value
+        in_stack = key in self.stack
+        if in_stack:
+            del self.nonresident[key]
+        if len(self.lir) < self.lir_size:
+            # Warm-up: the first lir_size distinct lines become LIR
+            self.lir.add(key)
+            self.stack[key] = None
+            self.stack.move_to_end(key)
+        elif in_stack:
+            self._promote(key)
+        else:
+            self.stack[key] = None
+            self.queue[key] = None
+
+        if self.verbose:
+            return f"Cache miss: Added {key} -> {value}"
+        return False
+
+    def _promote(self, key):
+        # A HIR key reused within S becomes LIR; the bottom LIR key is demoted to Q
+        self.queue.pop(key, None)
+        self.lir.add(key)
+        self.stack[key] = None
+        self.stack.move_to_end(key)
+        if len(self.lir) > self.lir_size:
+            self._prune()  # Only needed while S has no LIR key yet (tiny capacities)
+            bottom, _ = self.stack.popitem(last=False)
+            self.lir.discard(bottom)
+            self.queue[bottom] = None
+            self._prune()
+
+    def _prune(self):
+        stack = self.stack
+        while stack:
+            bottom = next(iter(stack))
+            if bottom in self.lir:
+                break
+            del stack[bottom]
+            self.nonresident.pop(bottom, None)
+
+    def evict(self):
+        if self.queue:
+            key, _ = self.queue.popitem(last=False)
+            value = self.values.pop(key)
+            if key in self.stack:
+                # Keep its recency so a quick return promotes it
+                self.nonresident[key] = None
+                if len(self.nonresident) > self.max_nonresident:
+                    oldest, _ = self.nonresident.popitem(last=False)
+                    del self.stack[oldest]
+        else:
+            # No resident HIR line (only after invalidations): evict the bottom LIR line
+            self._prune()
+            key, _ = self.stack.popitem(last=False)
+            self.lir.discard(key)
+            value = self.values.pop(key)
+            self._prune()
+        self.stats.record_eviction("LIRS", key, value)
+        return key, value
+
+    def __contains__(self, key):
+        return key in self.values
+
+    def invalidate(self, key):
+        # Drop a resident line without counting an eviction (e.g. back-invalidation)
+        if key not in self.values:
+            return False
+        del self.values[key]
+        if key in self.lir:
+            self.lir.discard(key)
+            del self.stack[key]
+            self._prune()
+        else:
+            self.queue.pop(key, None)
+            self.stack.pop(key, None)
+        return True
+
+    def display(self):
+        # Resident HIR lines (next victims first), then LIR lines from the bottom of S
+        lir = [(key, self.values[key]) for key in self.stack if key in self.lir]
+        return [(key, self.values[key]) for key in self.queue] + lir
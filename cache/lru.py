@@ -0,0 +1,52 @@
+from collections import OrderedDict
+
+from cache.stats import CacheStats
+
+
+class LRUCache:
+    def __init__(self, capacity, verbose=False, log_every=0):
+        self.capacity = capacity
+        self.cache = OrderedDict()  # Maintains order of access
+        self.verbose = verbose  # Return descriptive strings instead of a hit flag
+        self.stats = CacheStats(log_every=log_every or int(verbose))
+
+    @property
+    def miss_count(self):
+        return self.stats.misses
+
+    @property
+    def total_count(self):
+        return self.stats.accesses
+
+    def access(self, key, value=None):
+        if key in self.cache:
+            self.cache.move_to_end(key)
+            self.stats.hits += 1
+            if self.verbose:
+                return f"Cache hit: {key} -> {self.cache[key]}"
+            return True
+
+        # Cache miss
+        self.stats.misses += 1
+        if len(self.cache) >= self.capacity:
+            # Remove the least recently used item (first item)
+            evicted_key, evicted_value = self.cache.popitem(last=False)
+            self.stats.record_eviction("LRU", evicted_key, evicted_value)
+        # Add new key-value pair
+        self.cache[key] = value
+        if self.verbose:
+            return f"Cache miss: Added {key} -> {value}"
+        return False
+
+    def __contains__(self, key):
+        return key in self.cache
+
+    def invalidate(self, key):
+        # Drop a resident line without counting an eviction (e.g. back-invalidation)
+        if key in self.cache:
+            del self.cache[key]
+            return True
+        return False
+
+    def display(self):
+        return list(self.cache.items())
@@ -0,0 +1,19 @@
+from typing import Protocol, runtime_checkable
+
+
+@runtime_checkable
+class Cache(Protocol):
+    # Interface shared by every online policy in the registry. access() returns True on
+    # a hit (a descriptive string with verbose=True); invalidate() drops a line without
+    # counting an eviction. The adaptive policies also take access(key, value, access_type)
+    # with the Dinero label. Offline oracles (cache.belady) replay whole traces with run().
+    capacity: int
+    stats: object  # cache.stats.CacheStats
+
+    def access(self, key, value=None): ...
+
+    def __contains__(self, key): ...
+
+    def invalidate(self, key): ...
+
+    def display(self): ...
@@ -0,0 +1,40 @@
+import importlib
+
+# Policy name -> (module, class). Modules are imported on first use, so listing or
+# resolving a plain policy never pays for NumPy-heavy learners, let alone torch.
+POLICIES = {
+    "LRU": ("cache.lru", "LRUCache"),
+    "FIFO": ("cache.fifo", "FIFOCache"),
+    "LFU": ("cache.lfu", "LFUCache"),
+    "ARC": ("cache.arc", "ARCCache"),
+    "2Q": ("cache.two_q", "TwoQCache"),
+    "CLOCK": ("cache.clock", "ClockCache"),
+    "S3-FIFO": ("cache.s3fifo", "S3FIFOCache"),
+    "LIRS": ("cache.lirs", "LIRSCache"),
+    "RL_SingleQ": ("rl.single_q", "RLAdaptiveCache"),
+    "RL_DoubleQ": ("rl.double_q", "RLAdaptiveCache"),
+    "Perceptron": ("rl.perceptron", "PerceptronAdaptiveCache"),
+    "RL_DQN": ("rl.dqn", "DQNAdaptiveCache"),
+    "Hawkeye": ("rl.hawkeye", "HawkeyeCache"),  # Reuse predictor trained from OPT decisions
+    "OPT": ("cache.belady", "BeladyCache"),  # Offline optimum, the lower bound for the rest
+}
+
+# Policies whose results depend on the random seed
+STOCHASTIC_POLICIES = {"RL_SingleQ", "RL_DoubleQ", "RL_DQN", "Perceptron"}
+
+
+def register(name, module_name, class_name, stochastic=False):
+    POLICIES[name] = (module_name, class_name)
+    if stochastic:
+        STOCHASTIC_POLICIES.add(name)
+
+
+def policy_class(name):
+    if name not in POLICIES:
+        raise ValueError(f"Unknown policy: {name}, expected one of {sorted(POLICIES)}")
+    module_name, class_name = POLICIES[name]
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def create(name, capacity, **params):
+    return policy_class(name)(capacity, **params)
@@ -0,0 +1,127 @@
+from collections import OrderedDict
+
+from cache.arc import ARCCache
+from cache.clock import ClockCache
+from cache.lfu_engine import LFUTracker
+from cache.lirs import LIRSCache
+from cache.s3fifo import S3FIFOCache
+from cache.two_q import TwoQCache
+
+# Policies with their own queues and ghost state. An adaptive cache can add them as extra
+# actions; each runs as a keys-only tracker that mirrors the resident lines.
+TRACKED_POLICIES = {
+    "ARC": ARCCache,
+    "2Q": TwoQCache,
+    "CLOCK": ClockCache,
+    "S3-FIFO": S3FIFOCache,
+    "LIRS": LIRSCache,
+}
+
+
+class ResidentSet:
+    # A single resident set that keeps LRU order, FIFO insertion order and LFU
+    # frequencies side by side. Adaptive caches pick which metadata drives the
+    # next eviction, so switching policy is O(1) and never copies or drops lines.
+    POLICIES = ("LRU", "FIFO", "LFU")
+
+    def __init__(self, capacity, extra_policies=()):
+        for policy in extra_policies:
+            if policy not in TRACKED_POLICIES:
+                raise ValueError(f"Unknown policy: {policy}, expected one of {sorted(TRACKED_POLICIES)}")
+        self.capacity = capacity
+        self.recency = OrderedDict()  # key -> value, least recently used first
+        self.arrival = OrderedDict()  # key -> None, oldest insertion first
+        self.lfu = LFUTracker()  # Frequency buckets with FIFO tie-breaking
+        # Trackers only ever see resident keys, so they never evict on their own
+        self.trackers = {policy: TRACKED_POLICIES[policy](capacity) for policy in extra_policies}
+        self.policies = self.POLICIES + tuple(self.trackers)
+
+    def __len__(self):
+        return len(self.recency)
+
+    def __contains__(self, key):
+        return key in self.recency
+
+    def is_full(self):
+        return len(self.recency) >= self.capacity
+
+    def get(self, key):
+        return self.recency.get(key)
+
+    def hit(self, key):
+        # A hit refreshes recency and frequency; FIFO order is insertion-only
+        self.recency.move_to_end(key)
+        self.lfu.touch(key)
+        if self.trackers:
+            for tracker in self.trackers.values():
+                tracker.access(key)
+
+    def insert(self, key, value=None):
+        self.recency[key] = value
+        self.arrival[key] = None
+        self.lfu.insert(key)
+        if self.trackers:
+            for tracker in self.trackers.values():
+                tracker.access(key)
+
+    def victim(self, policy):
+        if not self.recency:
+            return None
+        if policy == "LRU":
+            return next(iter(self.recency))
+        if policy == "FIFO":
+            return next(iter(self.arrival))
+        if policy == "LFU":
+            return self.lfu.victim()
+        raise ValueError(f"Unknown policy: {policy}")
+
+    def evict(self, policy):
+        # Remove and return the (key, value) chosen by the given policy's metadata
+        if policy == "LRU":
+            key, value = self.recency.popitem(last=False)
+            del self.arrival[key]
+            self.lfu.remove(key)
+        elif policy == "FIFO":
+            key, _ = self.arrival.popitem(last=False)
+            value = self.recency.pop(key)
+            self.lfu.remove(key)
+        elif policy == "LFU":
+            key = self.lfu.evict()
+            del self.arrival[key]
+            value = self.recency.pop(key)
+        elif policy in self.trackers:
+            key, _ = self.trackers[policy].evict()
+            value = self.recency.pop(key)
+            del self.arrival[key]
+            self.lfu.remove(key)
+        else:
+            raise ValueError(f"Unknown policy: {policy}")
+        if self.trackers:
+            for name, tracker in self.trackers.items():
+                if name != policy:
+                    tracker.invalidate(key)
+        return key, value
+
+    def remove(self, key):
+        value = self.recency.pop(key)
+        del self.arrival[key]
+        self.lfu.remove(key)
+        for tracker in self.trackers.values():
+            tracker.invalidate(key)
+        return value
+
+    def clear(self):
+        self.recency.clear()
+        self.arrival.clear()
+        self.lfu.clear()
+        self.trackers = {policy: TRACKED_POLICIES[policy](self.capacity) for policy in self.trackers}
+
+    def items(self, policy="LRU"):
+        # Resident (key, value) pairs in the eviction order of the given policy
+        if policy == "LRU":
+            return list(self.recency.items())
+        if policy == "FIFO":
+            return [(key, self.recency[key]) for key in self.arrival]
+        if policy in self.trackers:
+            return [(key, self.recency[key]) for key, _ in self.trackers[policy].display()]
+        return sorted(self.recency.items(), key=lambda item: self.lfu.frequency(item[0]))
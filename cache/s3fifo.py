@@ -0,0 +1,104 @@
+from collections import OrderedDict
+
+from cache.stats import CacheStats
+
+
+class S3FIFOCache:
+    # S3-FIFO (Yang et al., SOSP '23). A small FIFO, about 10% of capacity, filters out
+    # one-hit wonders. Lines that are re-referenced while in it move to the main FIFO.
+    # A ghost FIFO remembers keys dropped from the small queue, and a returning key goes
+    # straight to main. Hits only bump a 2-bit counter, so the hit path never moves a line.
+    def __init__(self, capacity, small_ratio=0.1, verbose=False, log_every=0):
+        self.capacity = capacity
+        self.small_size = max(1, int(capacity * small_ratio))
+        self.ghost_size = max(1, capacity - self.small_size)
+        self.small = OrderedDict()  # key -> value, oldest first
+        self.main = OrderedDict()  # key -> value, oldest first
+        self.ghost = OrderedDict()  # Keys evicted from small, oldest first
+        self.freq = {}  # Resident key -> reference count, capped at 3
+        self.verbose = verbose  # Return descriptive strings instead of a hit flag
+        self.stats = CacheStats(log_every=log_every or int(verbose))
+
+    @property
+    def miss_count(self):
+        return self.stats.misses
+
+    @property
+    def total_count(self):
+        return self.stats.accesses
+
+    def access(self, key, value=None):
+        freq = self.freq.get(key)
+        if freq is not None:
+            if freq < 3:
+                self.freq[key] = freq + 1
+            self.stats.hits += 1
+            if self.verbose:
+                return f"Cache hit: {key} -> {self.small.get(key, self.main.get(key))}"
+            return True
+
+        # Cache miss
+        self.stats.misses += 1
+        if len(self.freq) >= self.capacity:
+            self.evict()
+        if key in self.ghost:
+            del self.ghost[key]
+            self.main[key] = value
+        else:
+            self.small[key] = value
+        self.freq[key] = 0
+
+        if self.verbose:
+            return f"Cache miss: Added {key} -> {value}"
+        return False
+
+    def evict(self):
+        if len(self.small) >= self.small_size or not self.main:
+            key, value = self._evict_small()
+        else:
+            key, value = self._evict_main()
+        self.stats.record_eviction("S3-FIFO", key, value)
+        return key, value
+
+    def _evict_small(self):
+        # Lines re-referenced in the small queue move to main; the first cold one leaves
+        while self.small:
+            key, value = self.small.popitem(last=False)
+            if self.freq[key] > 1:
+                self.main[key] = value
+                continue
+            del self.freq[key]
+            self.ghost[key] = None
+            if len(self.ghost) > self.ghost_size:
+                self.ghost.popitem(last=False)
+            return key, value
+        return self._evict_main()
+
+    def _evict_main(self):
+        # Referenced lines are reinserted with their count decremented
+        while True:
+            key, value = self.main.popitem(last=False)
+            freq = self.freq[key]
+            if freq > 0:
+                self.freq[key] = freq - 1
+                self.main[key] = value
+                continue
+            del self.freq[key]
+            return key, value
+
+    def __contains__(self, key):
+        return key in self.freq
+
+    def invalidate(self, key):
+        # Drop a resident line without counting an eviction (e.g. back-invalidation)
+        if key not in self.freq:
+            return False
+        del self.freq[key]
+        if key in self.small:
+            del self.small[key]
+        else:
+            del self.main[key]
+        return True
+
+    def display(self):
+        return list(self.small.items()) + list(self.main.items())
@@ -0,0 +1,52 @@
+from cache.fifo import FIFOCache
+from cache.lfu import LFUCache
+from cache.lru import LRUCache
+from cache.resident_set import TRACKED_POLICIES
+
+# Policy name -> class that can run as a shadow (any cache with access/invalidate/stats)
+SHADOW_POLICIES = {
+    "LRU": LRUCache,
+    "FIFO": FIFOCache,
+    "LFU": LFUCache,
+    **TRACKED_POLICIES,
+}
+
+
+class ShadowCaches:
+    # Metadata-only copies of each candidate policy, fed the same reference stream as
+    # the live cache (ghost lists in the ARC/ACME sense). They hold keys but no values,
+    # and give every policy a counterfactual hit/miss on every access, so an agent
+    # learns how all policies would have done instead of only the one it picked.
+    def __init__(self, capacity, policies=("LRU", "FIFO", "LFU")):
+        for policy in policies:
+            if policy not in SHADOW_POLICIES:
+                raise ValueError(f"unknown shadow policy {policy!r}, expected one of {sorted(SHADOW_POLICIES)}")
+        self.policies = tuple(policies)
+        self.caches = [SHADOW_POLICIES[policy](capacity) for policy in self.policies]
+        self._marks = [(0, 0, 0)] * len(self.caches)  # (hits, misses, evictions) at window start
+
+    def access(self, key):
+        # Per-policy hit flags for this reference, in self.policies order
+        return [cache.access(key) for cache in self.caches]
+
+    def invalidate(self, key):
+        for cache in self.caches:
+            cache.invalidate(key)
+
+    def window_rewards(self):
+        # Mean reward per policy since the previous call, on the live caches' scale:
+        # +1 per hit, -1 per miss into a free slot, -2 per miss that displaced a line
+        rewards = []
+        for index, cache in enumerate(self.caches):
+            stats = cache.stats
+            hits, misses, evictions = self._marks[index]
+            window_hits = stats.hits - hits
+            window_misses = stats.misses - misses
+            window_evictions = stats.evictions - evictions
+            accesses = window_hits + window_misses
+            rewards.append((window_hits - window_misses - window_evictions) / accesses if accesses else 0.0)
+            self._marks[index] = (stats.hits, stats.misses, stats.evictions)
+        return rewards
+
+    def hit_rates(self):
+        return {policy: cache.stats.hit_rate for policy, cache in zip(self.policies, self.caches)}
@@ -0,0 +1,72 @@
+class CacheStats:
+    # Structured hit/miss/eviction counters shared by every cache policy.
+    # Eviction logging is off by default; log_every=N prints every Nth eviction.
+    __slots__ = ("hits", "misses", "evictions", "last_evicted", "log_every")
+
+    def __init__(self, log_every=0):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.last_evicted = None
+        self.log_every = log_every
+
+    @property
+    def accesses(self):
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self):
+        return self.hits / self.accesses if self.accesses > 0 else 0
+
+    @property
+    def miss_rate(self):
+        return self.misses / self.accesses if self.accesses > 0 else 0
+
+    def record_eviction(self, policy, key, value=None):
+        self.evictions += 1
+        self.last_evicted = key
+        if self.log_every and self.evictions % self.log_every == 0:
+            print(f"Evicting {policy}: {key} -> {value}")
+
+    def reset(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.last_evicted = None
+
+    def as_dict(self):
+        return {
+            "accesses": self.accesses,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate,
+            "miss_rate": self.miss_rate,
+        }
+
+    def report(self, name=None):
+        if name is not None:
+            print(f"{name}")
+        print(f"Total number of traces: {self.accesses}")
+        print(f"Total Cache Misses: {self.misses} ({self.miss_rate * 100:.2f}%)")
+        print(f"Total Cache Hits: {self.hits} ({self.hit_rate * 100:.2f}%)")
+        print(f"Total Evictions: {self.evictions}")
+
+
+class AccessOutcome:
+    # Typed per-access record used by the adaptive caches' learning path
+    __slots__ = ("hit", "policy", "evicted_key", "access_type")
+
+    def __init__(self, hit, policy, evicted_key=None, access_type=None):
+        self.hit = hit
+        self.policy = policy  # Policy that served the access ("LRU", "FIFO", ...)
+        self.evicted_key = evicted_key  # Key displaced by a miss, None for hits and cold fills
+        self.access_type = access_type  # Dinero label: 0 read, 1 write, 2 instruction fetch
+
+    @property
+    def evicted(self):
+        return self.evicted_key is not None
+
+    def __repr__(self):
+        return (f"AccessOutcome(hit={self.hit}, policy={self.policy!r}, "
+                f"evicted_key={self.evicted_key!r}, access_type={self.access_type!r})")
@@ -0,0 +1,82 @@
+from collections import OrderedDict
+
+from cache.stats import CacheStats
+
+
+class TwoQCache:
+    # Full 2Q (Johnson & Shasha). New lines enter A1in, a FIFO of about kin * capacity.
+    # Lines pushed out of A1in are remembered as keys in the A1out ghost FIFO, and a
+    # reference while in A1out admits the line to Am, an LRU. One-shot scans pass
+    # through A1in without disturbing Am, and A1in hits move nothing.
+    def __init__(self, capacity, kin=0.25, kout=0.5, verbose=False, log_every=0):
+        self.capacity = capacity
+        self.kin = max(1, int(capacity * kin))  # Target size of A1in
+        self.kout = max(1, int(capacity * kout))  # Ghost keys kept in A1out
+        self.a1in = OrderedDict()  # key -> value, oldest first
+        self.a1out = OrderedDict()  # Ghost keys, oldest first
+        self.am = OrderedDict()  # key -> value, least recently used first
+        self.verbose = verbose  # Return descriptive strings instead of a hit flag
+        self.stats = CacheStats(log_every=log_every or int(verbose))
+
+    @property
+    def miss_count(self):
+        return self.stats.misses
+
+    @property
+    def total_count(self):
+        return self.stats.accesses
+
+    def access(self, key, value=None):
+        if key in self.am:
+            self.am.move_to_end(key)
+            self.stats.hits += 1
+            if self.verbose:
+                return f"Cache hit: {key} -> {self.am[key]}"
+            return True
+        if key in self.a1in:
+            # Correlated re-reference: leave it in the FIFO
+            self.stats.hits += 1
+            if self.verbose:
+                return f"Cache hit: {key} -> {self.a1in[key]}"
+            return True
+
+        # Cache miss
+        self.stats.misses += 1
+        if len(self.a1in) + len(self.am) >= self.capacity:
+            self.evict()
+        if key in self.a1out:
+            del self.a1out[key]
+            self.am[key] = value
+        else:
+            self.a1in[key] = value
+
+        if self.verbose:
+            return f"Cache miss: Added {key} -> {value}"
+        return False
+
+    def evict(self):
+        if len(self.a1in) > self.kin or not self.am:
+            key, value = self.a1in.popitem(last=False)
+            self.a1out[key] = None
+            if len(self.a1out) > self.kout:
+                self.a1out.popitem(last=False)
+        else:
+            key, value = self.am.popitem(last=False)
+        self.stats.record_eviction("2Q", key, value)
+        return key, value
+
+    def __contains__(self, key):
+        return key in self.am or key in self.a1in
+
+    def invalidate(self, key):
+        # Drop a resident line without counting an eviction (e.g. back-invalidation)
+        if key in self.am:
+            del self.am[key]
+            return True
+        if key in self.a1in:
+            del self.a1in[key]
+            return True
+        return False
+
+    def display(self):
+        return list(self.a1in.items()) + list(self.am.items())
@@ -0,0 +1,76 @@
+import argparse
+import json
+import os
+
+from cache.registry import POLICIES, STOCHASTIC_POLICIES
+
+DEFAULT_CONFIG = "config.json"
+
+# Used for anything neither the config file nor the command line sets
+DEFAULTS = {
+    "trace": "traces/all_policy_trace",
+    "policies": ["LRU"],
+    "capacities": [256],
+    "params": {},  # Policy name -> constructor keyword arguments
+    "geometry": None,  # {"line_size": ..., "associativity": ...} for a set-associative cache
+    "seed": 0,
+    "warm_start": None,  # rl.checkpoint file with pretrained state for the learned policies
+}
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Simulate cache replacement policies on a memory trace")
+    parser.add_argument("--trace", help="Dinero text trace (plain or compressed) or its .bin copy")
+    parser.add_argument("--policy", action="append", choices=sorted(POLICIES), help="Policy to run (repeatable)")
+    parser.add_argument("--capacity", type=int, action="append", help="Cache capacity in lines (repeatable)")
+    parser.add_argument("--config", help=f"JSON settings file (default: {DEFAULT_CONFIG} if present)")
+    parser.add_argument("--seed", type=int, help="Random seed for the stochastic policies")
+    parser.add_argument("--warm-start", help="Pretrained state from python -m rl.pretrain")
+    return parser.parse_args(argv)
+
+
+def load_config(args):
+    config = dict(DEFAULTS)
+    path = args.config or (DEFAULT_CONFIG if os.path.exists(DEFAULT_CONFIG) else None)
+    if path:
+        with open(path) as fp:
+            config.update(json.load(fp))
+    # Command-line flags override the file
+    if args.trace:
+        config["trace"] = args.trace
+    if args.policy:
+        config["policies"] = args.policy
+    if args.capacity:
+        config["capacities"] = args.capacity
+    if args.seed is not None:
+        config["seed"] = args.seed
+    if args.warm_start:
+        config["warm_start"] = args.warm_start
+    return config
+
+
+def main(argv=None):
+    config = load_config(parse_args(argv))
+    # Deferred so argument errors and --help never import NumPy
+    from sim.sweep import run_cell
+
+    print(config["trace"])
+    for policy in config["policies"]:
+        params = dict(config["params"].get(policy, {}))
+        if config["warm_start"]:
+            params.setdefault("warm_start", config["warm_start"])  # Ignored by policies it has no state for
+        for capacity in config["capacities"]:
+            row = run_cell({
+                "trace": config["trace"],
+                "policy": policy,
+                "capacity": capacity,
+                "geometry": config["geometry"],
+                "params": params,
+                "seed": config["seed"] if policy in STOCHASTIC_POLICIES else None,
+            })
+            print(f"{policy} capacity {capacity}: {row['misses']} misses / {row['accesses']} accesses "
+                  f"({row['miss_rate'] * 100:.2f}%), {row['evictions']} evictions, {row['wall_time']:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+# Learned policy selectors (Q-learning, perceptrons) over the cache package's policies
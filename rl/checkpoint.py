@@ -0,0 +1,65 @@
+import json
+import os
+
+# Agent state is saved as JSON: a checkpoint maps policy names (as in cache.registry) to the
+# state_dict() of a trained agent, so one warm-start file can carry every learned policy.
+#   {"version": 1, "agents": {"RL_DoubleQ": {...}, "Perceptron": {...}}, ...metadata}
+VERSION = 1
+
+
+def save_checkpoint(path, agents, **metadata):
+    # agents: policy name -> agent or state dict
+    states = {name: agent if isinstance(agent, dict) else agent.state_dict() for name, agent in agents.items()}
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as fp:
+        json.dump({"version": VERSION, **metadata, "agents": states}, fp)
+    os.replace(tmp_path, path)
+    return path
+
+
+def load_checkpoint(path):
+    with open(path) as fp:
+        checkpoint = json.load(fp)
+    if checkpoint.get("version") != VERSION:
+        raise ValueError(f"{path}: unsupported checkpoint version {checkpoint.get('version')}")
+    return checkpoint
+
+
+def warm_start(agent, path, name):
+    # Load the saved state for policy `name` into a fresh agent; False if the file has none
+    state = load_checkpoint(path)["agents"].get(name)
+    if state is None or not hasattr(agent, "load_state_dict"):
+        return False
+    agent.load_state_dict(state)
+    return True
+
+
+def merge_state_dicts(states, weights=None):
+    # Weighted element-wise mean of numeric leaves (Q-tables, epsilon); everything else
+    # (policy lists, feature flags) must agree across the inputs. Only meaningful where the
+    # same entry means the same thing in every input, not for independently trained weights.
+    if not states:
+        raise ValueError("Nothing to merge")
+    if weights is None:
+        weights = [1] * len(states)
+    total = sum(weights)
+    if total <= 0:
+        raise ValueError("merge weights must sum to a positive value")
+    return _merge(list(states), [weight / total for weight in weights])
+
+
+def _merge(values, weights):
+    first = values[0]
+    if isinstance(first, dict):
+        if any(set(value) != set(first) for value in values):
+            raise ValueError(f"Cannot merge states with different keys: {sorted(first)}")
+        return {key: _merge([value[key] for value in values], weights) for key in first}
+    if isinstance(first, list) and first and not all(isinstance(item, str) for item in first):
+        if any(len(value) != len(first) for value in values):
+            raise ValueError("Cannot merge tables of different shapes")
+        return [_merge([value[index] for value in values], weights) for index in range(len(first))]
+    if isinstance(first, float) or (isinstance(first, int) and not isinstance(first, bool)):
+        return sum(weight * value for weight, value in zip(weights, values))
+    if any(value != first for value in values):
+        raise ValueError(f"Cannot merge differing values: {first!r} vs {next(v for v in values if v != first)!r}")
+    return first
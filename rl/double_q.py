@@ -0,0 +1,239 @@
+from math import exp
+
+import numpy as np
+
+from cache.resident_set import ResidentSet
+from cache.shadow import ShadowCaches
+from cache.stats import AccessOutcome, CacheStats
+from rl.workload_features import WorkloadFeatures
+
+RANDOM_BUFFER = 4096  # Uniform draws fetched from NumPy per call, consumed one at a time
+
+
+def _argmax(row):
+    # First index of the largest entry, like np.argmax
+    return max(range(len(row)), key=row.__getitem__)
+
+
+class RLAdaptiveCache:
+    def __init__(self, capacity, threshold=3, epsilon=0.2, alpha=0.2, gamma=0.95, num_episodes=100,
+                 window=64, shadow=False, features=False, extra_policies=(),
+                 verbose=False, log_every=0):
+        if window < 1:
+            raise ValueError(f"window must be at least 1, got {window}")
+        self.capacity = capacity
+        self.threshold = threshold  # Threshold for switching modes
+        self.epsilon = epsilon  # Exploration rate for Q-learning
+        self.alpha = alpha  # Learning rate for Q-learning
+        self.gamma = gamma  # Discount factor for Q-learning
+        self.num_episodes = num_episodes
+        # Accesses per decision. Between decisions an access only runs the chosen policy;
+        # 1 decides and learns on every access, at several times the per-access cost.
+        self.window = window
+        # Shared lines with LRU, FIFO and LFU metadata, plus trackers for any extra policies
+        self.resident = ResidentSet(capacity, extra_policies)
+        self.policies = self.resident.policies  # Action i evicts by policies[i]
+        # Optional ghost caches: every action is rewarded from its own counterfactual outcome
+        self.shadow = ShadowCaches(capacity, self.policies) if shadow else None
+        # Optional workload statistics that split each policy state into workload buckets
+        self.features = WorkloadFeatures(capacity) if features else None
+        self.mode = "LRU"
+        self.miss_count = 0  # Misses since the last mode switch
+        self.hit_rate = 0
+        self.verbose = verbose  # Return descriptive strings and log decisions
+        self.stats = CacheStats(log_every=log_every or int(verbose))
+        # Most recent access as scalars; last_outcome builds the AccessOutcome on demand
+        self._last_hit = None
+        self._last_evicted = None
+        self._last_access_type = None
+
+        # Plain nested lists: NumPy's per-call overhead on 3-element rows costs more
+        # than the cache operation the decision steers
+        num_actions = len(self.policies)
+        num_states = num_actions * (WorkloadFeatures.num_states if features else 1)
+        self.q_table1 = [[0.0] * num_actions for _ in range(num_states)]
+        self.q_table2 = [[0.0] * num_actions for _ in range(num_states)]
+        self.state = 0
+        self.action = 0  # Eviction policy used for the current window
+        self.window_pos = 0  # Accesses made in the current window
+        self.window_reward = 0  # Reward summed over the current window
+        self._uniforms = []
+        self._uniform_pos = 0
+
+    @property
+    def total_miss_count(self):
+        return self.stats.misses
+
+    @property
+    def total_count(self):
+        return self.stats.accesses
+
+    @property
+    def last_outcome(self):
+        # AccessOutcome of the most recent access, built here so the access path allocates none
+        if self._last_hit is None:
+            return None
+        return AccessOutcome(self._last_hit, self.policies[self.action], self._last_evicted, self._last_access_type)
+
+    def access(self, key, value=None, access_type=None):
+        # Decisions are made once per window; accesses inside it only run the chosen policy
+        if self.window_pos == 0:
+            self.action = self._choose_action()
+        if self.shadow is not None:
+            self.shadow.access(key)
+
+        # Action 0 evicts by LRU, 1 by FIFO, 2 by LFU, then any extra policies
+        resident = self.resident
+        hit = key in resident.recency
+        if hit:
+            resident.hit(key)
+            self.stats.hits += 1
+            self.window_reward += 1
+            evicted_key = None
+        else:
+            evicted_key = self._miss(key, value, self.policies[self.action])
+            self.window_reward += self._get_reward(False, evicted_key)
+        self._last_hit = hit
+        self._last_evicted = evicted_key
+        self._last_access_type = access_type
+        if self.features is not None:
+            self.features.record(key, hit, access_type)
+
+        self.window_pos += 1
+        if self.window_pos >= self.window:
+            self._end_window()
+
+        if self.verbose:
+            return f"Cache {'hit' if hit else 'miss'} ({self.policies[self.action]}): {key} -> {value}"
+        return hit
+
+    def _end_window(self):
+        # Learn from the window's mean reward, so alpha means the same for every window size
+        self.hit_rate = (self.total_count - self.miss_count) / self.total_count
+        state = self.state  # Row the window's action was chosen from
+
+        if self.miss_count > self.threshold and self.hit_rate < 0.4:
+            q1, q2 = self.q_table1[state], self.q_table2[state]
+            best_action = _argmax([a + b for a, b in zip(q1, q2)])  # Double Q-learning update
+            if best_action != state % len(self.policies):
+                self._switch_mode(best_action)
+        if self.features is not None:
+            self.state = self._encode_state(self.policies.index(self.mode))
+
+        if self.shadow is None:
+            self._update_q_table(self.window_reward / self.window_pos, self.action, state)
+        else:
+            for action, reward in enumerate(self.shadow.window_rewards()):
+                self._update_q_table(reward, action, state)
+
+        self.epsilon = max(0.01, self.epsilon * 0.995 ** self.window_pos)
+        self.window_pos = 0
+        self.window_reward = 0
+
+    def _uniform(self):
+        # Pre-drawn uniforms: one NumPy call per RANDOM_BUFFER draws instead of one per decision
+        if self._uniform_pos == len(self._uniforms):
+            self._uniforms = np.random.random(RANDOM_BUFFER).tolist()
+            self._uniform_pos = 0
+        draw = self._uniforms[self._uniform_pos]
+        self._uniform_pos += 1
+        return draw
+
+    def _choose_action(self):
+        # Softmax over Q1 + Q2, sampled by walking the cumulative weights
+        preferences = [a + b for a, b in zip(self.q_table1[self.state], self.q_table2[self.state])]
+        if self.shadow is not None:
+            # Every action is already evaluated by its shadow, so there is nothing to explore
+            return _argmax(preferences)
+        top = max(preferences)
+        weights = [exp(preference - top) for preference in preferences]
+        remaining = self._uniform() * sum(weights)
+        for action, weight in enumerate(weights):
+            remaining -= weight
+            if remaining < 0:
+                return action
+        return len(weights) - 1
+
+    def _miss(self, key, value, policy):
+        # Fill a missing line, evicting by `policy` when full; returns the evicted key or None
+        resident = self.resident
+        self.miss_count += 1
+        self.stats.misses += 1
+        evicted_key = None
+        if len(resident.recency) >= self.capacity:
+            # LFU ties are broken by age inside the resident set
+            evicted_key, evicted_value = resident.evict(policy)
+            self.stats.record_eviction(policy, evicted_key, evicted_value)
+        resident.insert(key, value)
+        return evicted_key
+
+    def _switch_mode(self, best_action):
+        # Every policy's metadata is kept up to date, so a switch is O(1) and keeps all lines
+        self.state = self._encode_state(best_action)
+        self.mode = self.policies[best_action]
+        if self.verbose:
+            print(f"Switching to {self.mode} mode...")
+        self.miss_count = 0
+
+    def _encode_state(self, policy_index):
+        # Q-table row: workload bucket x current policy (a single bucket without features)
+        if self.features is None:
+            return policy_index
+        return self.features.state() * len(self.policies) + policy_index
+
+    def _get_reward(self, hit, evicted_key):
+        if hit:
+            return 1
+        else:
+            evicted_value = self._get_eviction_impact(evicted_key)
+            return -1 * evicted_value
+
+    def _get_eviction_impact(self, evicted_key):
+        # Displacing a resident line costs more than filling a free slot
+        if evicted_key is not None:
+            return 2
+        return 1
+
+    def _update_q_table(self, reward, action, state):
+        next_state = self.state
+        if self._uniform() < 0.5:
+            best_next_action = _argmax(self.q_table1[next_state])
+            self.q_table1[state][action] += self.alpha * (reward + self.gamma * self.q_table2[next_state][best_next_action] - self.q_table1[state][action])
+        else:
+            best_next_action = _argmax(self.q_table2[next_state])
+            self.q_table2[state][action] += self.alpha * (reward + self.gamma * self.q_table1[next_state][best_next_action] - self.q_table2[state][action])
+
+    def state_dict(self):
+        # Learned state only (no resident lines), as plain lists for rl.checkpoint
+        return {
+            "policies": list(self.policies),
+            "features": self.features is not None,
+            "q_table1": [list(row) for row in self.q_table1],
+            "q_table2": [list(row) for row in self.q_table2],
+            "epsilon": self.epsilon,
+        }
+
+    def load_state_dict(self, state):
+        if list(state["policies"]) != list(self.policies):
+            raise ValueError(f"State is for policies {state['policies']}, this cache uses {list(self.policies)}")
+        if state["features"] != (self.features is not None):
+            raise ValueError(f"State was trained with features={state['features']}, this cache has "
+                             f"features={self.features is not None}")
+        self.q_table1 = [[float(value) for value in row] for row in state["q_table1"]]
+        self.q_table2 = [[float(value) for value in row] for row in state["q_table2"]]
+        self.epsilon = state["epsilon"]
+
+    def __contains__(self, key):
+        return key in self.resident
+
+    def invalidate(self, key):
+        # Drop a resident line without counting an eviction (e.g. back-invalidation)
+        if self.shadow is not None:
+            self.shadow.invalidate(key)
+        if key in self.resident:
+            self.resident.remove(key)
+            return True
+        return False
+
+    def display(self):
+        return f"Cache ({self.mode}): {self.resident.items(self.mode)}"
@@ -0,0 +1,224 @@
+import numpy as np
+
+from cache.resident_set import ResidentSet
+from cache.stats import AccessOutcome, CacheStats
+from rl.workload_features import WorkloadFeatures
+
+
+class QNetwork:
+    # Two-layer MLP Q(s, .) in plain NumPy: inputs -> ReLU hidden layer -> one value per action,
+    # trained with Adam on a Huber TD loss
+    def __init__(self, inputs, hidden, actions, lr=1e-3, beta1=0.9, beta2=0.999):
+        self.params = [
+            np.random.randn(inputs, hidden) * np.sqrt(2.0 / inputs),  # He initialisation for ReLU
+            np.zeros(hidden),
+            np.random.randn(hidden, actions) * np.sqrt(1.0 / hidden),
+            np.zeros(actions),
+        ]
+        self.lr = lr
+        self.beta1 = beta1
+        self.beta2 = beta2
+        self.steps = 0
+        self._m = [np.zeros_like(param) for param in self.params]
+        self._v = [np.zeros_like(param) for param in self.params]
+
+    def predict(self, states):
+        w1, b1, w2, b2 = self.params
+        return np.maximum(states @ w1 + b1, 0) @ w2 + b2
+
+    def copy_from(self, other):
+        for param, source in zip(self.params, other.params):
+            param[...] = source
+
+    def train_step(self, states, actions, targets):
+        # One minibatch step on (Q(s, a) - target), with the error clipped to [-1, 1] (Huber)
+        w1, b1, w2, b2 = self.params
+        rows = np.arange(len(actions))
+        hidden = np.maximum(states @ w1 + b1, 0)
+        q = hidden @ w2 + b2
+        error = np.clip(q[rows, actions] - targets, -1.0, 1.0)
+        grad_q = np.zeros_like(q)
+        grad_q[rows, actions] = error / len(actions)
+        grad_hidden = (grad_q @ w2.T) * (hidden > 0)
+        grads = [states.T @ grad_hidden, grad_hidden.sum(axis=0), hidden.T @ grad_q, grad_q.sum(axis=0)]
+
+        self.steps += 1
+        correction1 = 1 - self.beta1 ** self.steps
+        correction2 = 1 - self.beta2 ** self.steps
+        for param, grad, m, v in zip(self.params, grads, self._m, self._v):
+            m *= self.beta1
+            m += (1 - self.beta1) * grad
+            v *= self.beta2
+            v += (1 - self.beta2) * grad * grad
+            param -= self.lr * (m / correction1) / (np.sqrt(v / correction2) + 1e-8)
+        return float(np.mean(error * error))
+
+
+class DQNAdaptiveCache:
+    def __init__(self, capacity, window=64, hidden=32, gamma=0.9, lr=1e-3, epsilon=0.2, epsilon_min=0.01,
+                 epsilon_decay=0.99, buffer_size=4096, batch_size=32, train_every=256, target_every=50,
+                 feature_window=1024, extra_policies=(), verbose=False, log_every=0):
+        if window < 1:
+            raise ValueError(f"window must be at least 1, got {window}")
+        if batch_size > buffer_size:
+            raise ValueError("batch_size cannot exceed buffer_size")
+        self.capacity = capacity
+        self.window = window  # Accesses per decision
+        self.gamma = gamma  # Discount factor
+        self.epsilon = epsilon  # Exploration rate, decayed once per decision
+        self.epsilon_min = epsilon_min
+        self.epsilon_decay = epsilon_decay
+        self.batch_size = batch_size
+        self.train_every = train_every  # Accesses between minibatch updates
+        self.target_every = target_every  # Minibatch updates between target network syncs
+        # Shared lines with LRU, FIFO and LFU metadata, plus trackers for any extra policies
+        self.resident = ResidentSet(capacity, extra_policies)
+        self.policies = self.resident.policies  # Action i evicts by policies[i]
+        self.features = WorkloadFeatures(capacity, window=feature_window)
+        self.mode = "LRU"
+        self.verbose = verbose  # Return descriptive strings and log decisions
+        self.stats = CacheStats(log_every=log_every or int(verbose))
+        self.last_outcome = None  # AccessOutcome of the most recent access
+
+        # State: windowed workload statistics plus a one-hot of the policy in use
+        num_actions = len(self.policies)
+        self.state_size = len(self.features.vector()) + num_actions
+        self.network = QNetwork(self.state_size, hidden, num_actions, lr)
+        self.target = QNetwork(self.state_size, hidden, num_actions, lr)
+        self.target.copy_from(self.network)
+
+        # Experience replay in preallocated arrays, overwritten as a ring
+        self.buffer_size = buffer_size
+        self._states = np.zeros((buffer_size, self.state_size))
+        self._actions = np.zeros(buffer_size, dtype=np.intp)
+        self._rewards = np.zeros(buffer_size)
+        self._next_states = np.zeros((buffer_size, self.state_size))
+        self._next = 0
+        self._stored = 0
+
+        self.action = 0  # Eviction policy used for the current window
+        self.state = None  # State vector the current window's action was chosen from
+        self.window_pos = 0
+        self.window_reward = 0
+        self.since_train = 0  # Accesses since the last minibatch update
+        self.updates = 0
+        self.loss = 0.0  # TD loss of the latest minibatch
+
+    @property
+    def total_miss_count(self):
+        return self.stats.misses
+
+    @property
+    def total_count(self):
+        return self.stats.accesses
+
+    def access(self, key, value=None, access_type=None):
+        # Decisions are made once per window; accesses inside it only run the chosen policy
+        if self.window_pos == 0:
+            self.state = self._state_vector()
+            self.action = self._choose_action(self.state)
+            if self.verbose and self.policies[self.action] != self.mode:
+                print(f"Switching to {self.policies[self.action]} mode...")
+            self.mode = self.policies[self.action]
+
+        outcome = self._access(key, value, self.mode)
+        outcome.access_type = access_type
+        self.last_outcome = outcome
+        self.features.record(key, outcome.hit, access_type)
+
+        self.window_reward += 1 if outcome.hit else (-2 if outcome.evicted else -1)
+        self.window_pos += 1
+        if self.window_pos >= self.window:
+            self._end_window()
+
+        if self.verbose:
+            return f"Cache {'hit' if outcome.hit else 'miss'} ({outcome.policy}): {key} -> {value}"
+        return outcome.hit
+
+    def _state_vector(self):
+        state = np.zeros(self.state_size)
+        vector = self.features.vector()
+        state[:len(vector)] = vector
+        state[len(vector) + self.policies.index(self.mode)] = 1.0
+        return state
+
+    def _choose_action(self, state):
+        # Epsilon-greedy over the online network's Q-values
+        if np.random.random() < self.epsilon:
+            return np.random.randint(len(self.policies))
+        return int(np.argmax(self.network.predict(state)))
+
+    def _end_window(self):
+        slot = self._next
+        self._states[slot] = self.state
+        self._actions[slot] = self.action
+        self._rewards[slot] = self.window_reward / self.window_pos
+        self._next_states[slot] = self._state_vector()
+        self._next = (slot + 1) % self.buffer_size
+        self._stored = min(self._stored + 1, self.buffer_size)
+
+        self.since_train += self.window_pos
+        if self.since_train >= self.train_every and self._stored >= self.batch_size:
+            self._train()
+        self.epsilon = max(self.epsilon_min, self.epsilon * self.epsilon_decay)
+        self.window_pos = 0
+        self.window_reward = 0
+
+    def _train(self):
+        # Double DQN target: the online network picks the next action, the target network values it
+        self.since_train = 0
+        batch = np.random.randint(0, self._stored, self.batch_size)
+        next_states = self._next_states[batch]
+        best_next = np.argmax(self.network.predict(next_states), axis=1)
+        next_values = self.target.predict(next_states)[np.arange(self.batch_size), best_next]
+        targets = self._rewards[batch] + self.gamma * next_values
+        self.loss = self.network.train_step(self._states[batch], self._actions[batch], targets)
+        self.updates += 1
+        if self.updates % self.target_every == 0:
+            self.target.copy_from(self.network)
+
+    def _access(self, key, value, policy):
+        resident = self.resident
+        if key in resident:
+            resident.hit(key)
+            self.stats.hits += 1
+            return AccessOutcome(True, policy)
+        self.stats.misses += 1
+        evicted_key = None
+        if resident.is_full():
+            evicted_key, evicted_value = resident.evict(policy)
+            self.stats.record_eviction(policy, evicted_key, evicted_value)
+        resident.insert(key, value)
+        return AccessOutcome(False, policy, evicted_key)
+
+    def state_dict(self):
+        # Learned state only (no resident lines or replay buffer), as plain lists for rl.checkpoint
+        return {
+            "policies": list(self.policies),
+            "network": [param.tolist() for param in self.network.params],
+            "epsilon": self.epsilon,
+        }
+
+    def load_state_dict(self, state):
+        if list(state["policies"]) != list(self.policies):
+            raise ValueError(f"State is for policies {state['policies']}, this cache uses {list(self.policies)}")
+        params = [np.array(values, dtype=float) for values in state["network"]]
+        if [param.shape for param in params] != [param.shape for param in self.network.params]:
+            raise ValueError("State was saved from a network with a different shape")
+        for param, values in zip(self.network.params, params):
+            param[...] = values
+        self.target.copy_from(self.network)
+        self.epsilon = state["epsilon"]
+
+    def __contains__(self, key):
+        return key in self.resident
+
+    def invalidate(self, key):
+        # Drop a resident line without counting an eviction (e.g. back-invalidation)
+        if key in self.resident:
+            self.resident.remove(key)
+            return True
+        return False
+
+    def display(self):
+        return f"Cache ({self.mode}): {self.resident.items(self.mode)}"
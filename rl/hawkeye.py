@@ -0,0 +1,133 @@
+from collections import OrderedDict
+
+import numpy as np
+
+from cache.belady import NEVER, next_use, opt_hits
+from cache.stats import CacheStats
+from sim.trace_format import load_trace
+
+# Hawkeye-style eviction: a table of saturating counters learns, per hashed access
+# signature, whether Belady's MIN would have kept the line until its next use. Lines
+# predicted cache-friendly are kept in LRU order; cache-averse lines are inserted into a
+# separate queue and evicted before any friendly line.
+#
+# There is no program counter in a Dinero trace, so a signature hashes the address
+# together with its access type (0 read, 1 write, 2 instruction fetch) at two
+# granularities: the exact line and its surrounding region.
+COUNTER_MAX = 7  # 3-bit counters
+COUNTER_INIT = 4  # Untrained signatures lean friendly, so an untrained cache behaves like LRU
+_HASH = 0x9E3779B97F4A7C15  # 64-bit Fibonacci hashing multiplier
+_MASK64 = (1 << 64) - 1
+
+
+class HawkeyeCache:
+    def __init__(self, capacity, table_bits=14, region_bits=6, detrain=False, train_trace=None,
+                 verbose=False, log_every=0):
+        self.capacity = capacity
+        self.table_bits = table_bits
+        self.region_bits = region_bits  # Low address bits dropped for the region signature
+        self.friendly = OrderedDict()  # key -> (value, signatures), LRU order
+        self.averse = OrderedDict()  # Evicted first, oldest first
+        self.verbose = verbose  # Return descriptive strings instead of a hit flag
+        self.stats = CacheStats(log_every=log_every or int(verbose))
+        # Plain lists: online lookups index one counter at a time
+        self.line_table = [COUNTER_INIT] * (1 << table_bits)
+        self.region_table = [COUNTER_INIT] * (1 << table_bits)
+        # Optionally decrement a signature whenever a line it predicted friendly is evicted.
+        # Off by default: with MIN labels the counters already encode the right answer, and
+        # detraining on every friendly eviction drags them toward averse.
+        self.detrain = detrain
+        self.trained = False
+        if train_trace is not None:
+            self.fit(*load_trace(train_trace))
+
+    @property
+    def miss_count(self):
+        return self.stats.misses
+
+    @property
+    def total_count(self):
+        return self.stats.accesses
+
+    def _signatures(self, key, access_type):
+        # Scalar twin of _signature_arrays
+        address = key if type(key) is int else hash(key) & _MASK64
+        label = access_type or 0
+        shift = 64 - self.table_bits
+        line = ((((address << 2) | label) * _HASH) & _MASK64) >> shift
+        region = (((((address >> self.region_bits) << 2) | label) * _HASH) & _MASK64) >> shift
+        return line, region
+
+    def _signature_arrays(self, labels, addresses):
+        addresses = np.asarray(addresses, dtype=np.uint64)
+        labels = np.zeros(len(addresses), dtype=np.uint64) if labels is None else np.asarray(labels, dtype=np.uint64)
+        shift = np.uint64(64 - self.table_bits)
+        two = np.uint64(2)
+        line = (((addresses << two) | labels) * np.uint64(_HASH)) >> shift
+        region = ((((addresses >> np.uint64(self.region_bits)) << two) | labels) * np.uint64(_HASH)) >> shift
+        return line.astype(np.intp), region.astype(np.intp)
+
+    def fit(self, labels, addresses):
+        # Label every reference by whether MIN at this capacity hits on the line's next use
+        # (never-reused lines are averse), then move each signature's counter by its net
+        # friendly-minus-averse count. Counting instead of replaying the updates in order
+        # makes the whole pass vectorized.
+        addresses = np.asarray(addresses)
+        following = next_use(addresses)
+        hits = opt_hits(addresses, self.capacity, next_uses=following)
+        reused = following != NEVER
+        friendly = np.zeros(len(addresses), dtype=bool)
+        friendly[reused] = hits[following[reused]]
+        votes = np.where(friendly, 1, -1)
+
+        size = 1 << self.table_bits
+        for name, signatures in zip(("line_table", "region_table"), self._signature_arrays(labels, addresses)):
+            net = np.bincount(signatures, weights=votes, minlength=size)
+            counters = np.clip(np.array(getattr(self, name)) + net, 0, COUNTER_MAX)
+            setattr(self, name, counters.astype(int).tolist())
+        self.trained = True
+        return friendly
+
+    def _predict_friendly(self, signatures):
+        line, region = signatures
+        return self.line_table[line] + self.region_table[region] >= 2 * COUNTER_INIT
+
+    def access(self, key, value=None, access_type=None):
+        signatures = self._signatures(key, access_type)
+        friendly = self._predict_friendly(signatures)
+        if key in self.friendly or key in self.averse:
+            # Re-predict on every hit: the line moves to the MRU end of its new queue
+            old_value, _ = self.friendly.pop(key, None) or self.averse.pop(key)
+            (self.friendly if friendly else self.averse)[key] = (old_value if value is None else value, signatures)
+            self.stats.hits += 1
+            if self.verbose:
+                return f"Cache hit ({'friendly' if friendly else 'averse'}): {key}"
+            return True
+
+        # Cache miss
+        self.stats.misses += 1
+        if len(self.friendly) + len(self.averse) >= self.capacity:
+            if self.averse:
+                evicted_key, (evicted_value, _) = self.averse.popitem(last=False)
+            else:
+                # No averse line left: the least recently used friendly line goes
+                evicted_key, (evicted_value, (line, region)) = self.friendly.popitem(last=False)
+                if self.detrain:
+                    self.line_table[line] = max(self.line_table[line] - 1, 0)
+                    self.region_table[region] = max(self.region_table[region] - 1, 0)
+            self.stats.record_eviction("Hawkeye", evicted_key, evicted_value)
+        (self.friendly if friendly else self.averse)[key] = (value, signatures)
+        if self.verbose:
+            return f"Cache miss ({'friendly' if friendly else 'averse'}): Added {key} -> {value}"
+        return False
+
+    def __contains__(self, key):
+        return key in self.friendly or key in self.averse
+
+    def invalidate(self, key):
+        # Drop a resident line without counting an eviction (e.g. back-invalidation)
+        return (self.friendly.pop(key, None) or self.averse.pop(key, None)) is not None
+
+    def display(self):
+        lines = list(self.averse.items()) + list(self.friendly.items())
+        return [(key, value) for key, (value, _) in lines]
@@ -0,0 +1,129 @@
+import numpy as np
+
+from cache.resident_set import ResidentSet
+from cache.stats import AccessOutcome, CacheStats
+from rl.workload_features import WorkloadFeatures
+
+# Feature vector: a constant bias term followed by windowed workload statistics, each in [0, 1]
+FEATURES = ("bias", "hit_rate", "working_set", "short_reuse", "stride", "ifetch")
+
+
+class PerceptronAdaptiveCache:
+    def __init__(self, capacity, alpha=0.1, window=96, temperature=1.0, feature_window=1024, extra_policies=(),
+                 verbose=False, log_every=0):
+        if window < 1:
+            raise ValueError(f"window must be at least 1, got {window}")
+        self.capacity = capacity
+        self.alpha = alpha  # Learning rate
+        self.window = window  # Accesses per decision; 1 decides and learns on every access
+        # Softmax temperature over the policy scores (in reward units); 0 picks greedily.
+        # Without exploration the first row whose estimate rises above the others wins forever.
+        self.temperature = temperature
+        # One set of lines carrying LRU, FIFO and LFU metadata, plus any extra policies' trackers
+        self.resident = ResidentSet(capacity, extra_policies)
+        self.policies = self.resident.policies  # Row i of the weights scores policies[i]
+        self.features = WorkloadFeatures(capacity, window=feature_window)
+        self.mode = "LRU"
+        self.verbose = verbose  # Return descriptive strings instead of a hit flag
+        self.stats = CacheStats(log_every=log_every or int(verbose))
+        self.last_outcome = None  # AccessOutcome of the most recent access
+
+        self.weights = np.zeros((len(self.policies), len(FEATURES)))
+        self.action = 0  # Row of the policy used for the current window
+        self.window_features = None  # Feature vector the current window's decision was made on
+        self.window_pos = 0
+        self.window_reward = 0
+
+    @property
+    def miss_count(self):
+        return self.stats.misses
+
+    @property
+    def total_miss_count(self):
+        return self.stats.misses
+
+    @property
+    def total_count(self):
+        return self.stats.accesses
+
+    def access(self, key, value=None, access_type=None):
+        # Decisions are made once per window; accesses inside it only run the chosen policy
+        if self.window_pos == 0:
+            self.window_features = self._extract_features()
+            self.action = self._choose_policy(self.window_features)
+            self.mode = self.policies[self.action]
+
+        outcome = self._access(key, value, self.mode)
+        outcome.access_type = access_type
+        self.last_outcome = outcome
+        self.features.record(key, outcome.hit, access_type)
+
+        self.window_reward += 0.5 if outcome.hit else -5
+        self.window_pos += 1
+        if self.window_pos >= self.window:
+            self._update_weights(self.window_features, self.window_reward / self.window_pos)
+            self.window_pos = 0
+            self.window_reward = 0
+
+        if self.verbose:
+            return f"Cache {'hit' if outcome.hit else 'miss'} ({outcome.policy}): {key} -> {value}"
+        return outcome.hit
+
+    def _extract_features(self):
+        # Windowed statistics only, so the scores stay bounded however long the trace runs
+        return np.array([1.0] + self.features.vector())
+
+    def _choose_policy(self, features):
+        # One matrix-vector product scores every policy, then a softmax draw over the scores
+        scores = self.weights @ features
+        if self.temperature <= 0:
+            return int(np.argmax(scores))  # Ties go to the first (LRU)
+        preferences = np.exp((scores - scores.max()) / self.temperature)
+        cumulative = np.cumsum(preferences)
+        return min(int(np.searchsorted(cumulative, np.random.random() * cumulative[-1], side="right")),
+                   len(scores) - 1)
+
+    def _access(self, key, value, policy):
+        resident = self.resident
+        if key in resident:
+            resident.hit(key)
+            self.stats.hits += 1
+            return AccessOutcome(True, policy)
+        else:
+            self.stats.misses += 1
+            evicted_key = None
+            if resident.is_full():
+                evicted_key, evicted_value = resident.evict(policy)
+                self.stats.record_eviction(policy, evicted_key, evicted_value)
+            resident.insert(key, value)
+            return AccessOutcome(False, policy, evicted_key)
+
+    def _update_weights(self, features, reward):
+        # Delta rule: the chosen row's score moves toward the observed mean reward, so each
+        # policy's weights converge to a bounded estimate instead of growing with the trace
+        error = reward - self.weights[self.action] @ features
+        self.weights[self.action] += self.alpha * error * features
+
+    def state_dict(self):
+        # Learned state only (no resident lines), as plain lists for rl.checkpoint
+        return {"policies": list(self.policies), "features": list(FEATURES), "weights": self.weights.tolist()}
+
+    def load_state_dict(self, state):
+        if list(state["policies"]) != list(self.policies):
+            raise ValueError(f"State is for policies {state['policies']}, this cache uses {list(self.policies)}")
+        if list(state["features"]) != list(FEATURES):
+            raise ValueError(f"State is for features {state['features']}, this cache uses {list(FEATURES)}")
+        self.weights = np.array(state["weights"], dtype=float)
+
+    def __contains__(self, key):
+        return key in self.resident
+
+    def invalidate(self, key):
+        # Drop a resident line without counting an eviction (e.g. back-invalidation)
+        if key in self.resident:
+            self.resident.remove(key)
+            return True
+        return False
+
+    def display(self):
+        return f"Cache ({self.mode}): {self.resident.items(self.mode)}"
@@ -0,0 +1,198 @@
+import math
+import operator
+
+import numpy as np
+import torch
+import torch.nn as nn
+import torch.optim as optim
+from collections import OrderedDict
+
+from cache.stats import CacheStats
+from sim.trace_reader import iter_trace_addresses
+
+
+# Inputs generated per access; a larger feature_size leaves the extra inputs at zero
+FEATURES = ("frequency", "age", "resident")
+
+
+class PerceptronModel(nn.Module):
+    def __init__(self, input_size):
+        super(PerceptronModel, self).__init__()
+        self.fc = nn.Linear(input_size, 1)
+
+    def forward(self, x):
+        return torch.sigmoid(self.fc(x))  # Sigmoid for binary classification
+
+class AdaptiveCache:
+    def __init__(self, capacity, feature_size=3, threshold=0.5, history=100, train_every=32, batch_size=None,
+                 verbose=False, log_every=0):
+        if train_every < 0:
+            raise ValueError("train_every must be >= 0 (0 trains only on explicit train_perceptron calls)")
+        if feature_size < len(FEATURES):
+            raise ValueError(f"feature_size must be at least {len(FEATURES)} ({', '.join(FEATURES)}), got {feature_size}")
+        self.capacity = capacity
+        self.cache = OrderedDict()  # Cache storage, kept in recency order (oldest first)
+        self.clock = 0  # Global access counter; entries store the stamp of their last access
+        self.threshold = threshold  # Threshold for eviction
+        self.feature_size = feature_size
+        self.perceptron = PerceptronModel(feature_size)  # Perceptron model
+        self.optimizer = optim.SGD(self.perceptron.parameters(), lr=0.1)
+        self.criterion = nn.BCELoss()  # Binary Cross-Entropy Loss
+        self.verbose = verbose  # Return descriptive strings instead of a hit flag
+        self.stats = CacheStats(log_every=log_every or int(verbose))
+        # Add counters for false positives and false negatives
+        self.false_positives = 0
+        self.false_negatives = 0
+
+        # Training samples go into preallocated ring buffers of the last `history` misses,
+        # and one SGD step over up to `batch_size` of the newest samples runs every
+        # `train_every` accesses instead of after each one
+        self.history = history
+        self.train_every = train_every
+        self.batch_size = batch_size or history
+        self._sample_features = np.zeros((history, feature_size), dtype=np.float32)
+        self._sample_labels = np.zeros(history, dtype=np.float32)
+        self._sample_next = 0  # Ring slot the next sample goes into
+        self._sample_count = 0
+        self._since_train = 0
+
+        # Inference uses the model's weights cached as Python floats, refreshed after each
+        # training step; prob > threshold is compared as logit > logit(threshold)
+        if threshold <= 0:
+            self._logit_threshold = -math.inf
+        elif threshold >= 1:
+            self._logit_threshold = math.inf
+        else:
+            self._logit_threshold = math.log(threshold / (1 - threshold))
+        self._refresh_weights()
+
+    @property
+    def miss_count(self):
+        return self.stats.misses
+
+    @property
+    def total_count(self):
+        return self.stats.accesses
+
+    def _refresh_weights(self):
+        self._weights = self.perceptron.fc.weight.detach()[0, :self.feature_size].tolist()
+        self._bias = self.perceptron.fc.bias.item()
+
+    def _generate_features(self, key):
+        entry = self.cache.get(key)
+        if entry is None:
+            return 0.0, 0.0, 0.0
+        return entry["frequency"], self.clock - entry["stamp"], 1.0  # Accesses since last touched
+
+    def access(self, key, value=None):
+        self.clock += 1
+        features = self._generate_features(key)
+        # map stops at its shortest input, the generated features: the weights of zero-padded inputs drop out
+        logit = sum(map(operator.mul, self._weights, features)) + self._bias
+        evict_predicted = logit > self._logit_threshold
+
+        # Training for the accesses so far happens before this one is simulated, as before
+        if self.train_every:
+            self._since_train += 1
+            if self._since_train >= self.train_every:
+                self.train_perceptron()
+
+        eviction_required = len(self.cache) >= self.capacity
+
+        if key in self.cache:
+            # Cache hit: Update frequency and recency stamp, move to the MRU end
+            entry = self.cache[key]
+            entry["frequency"] += 1
+            entry["stamp"] = self.clock
+            self.cache.move_to_end(key)
+            self.stats.hits += 1
+            if self.verbose:
+                return f"Cache hit: {key} -> {self.cache[key]['value']}"
+            return True
+
+        # Cache miss
+        self.stats.misses += 1
+        if len(self.cache) >= self.capacity:
+            # Predict eviction decision
+            if evict_predicted:
+                # Evict the least recently used element if predicted
+                evict_key, evicted = self.cache.popitem(last=False)
+                self.stats.record_eviction("Perceptron", evict_key, evicted["value"])
+
+        # Add the new key
+        self.cache[key] = {"value": value, "frequency": 1, "stamp": self.clock}
+
+        # Track false positives and false negatives
+        if evict_predicted and not eviction_required:
+            self.false_positives += 1  # Eviction predicted, but no eviction needed
+        elif not evict_predicted and eviction_required:
+            self.false_negatives += 1  # No eviction predicted, but eviction needed
+
+        # Store features and eviction decision for training
+        slot = self._sample_next
+        self._sample_features[slot, :len(features)] = features
+        self._sample_labels[slot] = 1.0 if len(self.cache) >= self.capacity else 0.0  # 1 = eviction needed
+        self._sample_next = (slot + 1) % self.history
+        if self._sample_count < self.history:
+            self._sample_count += 1
+
+        if self.verbose:
+            return f"Cache miss: Added {key} -> {value}"
+        return False
+
+    def train_perceptron(self):
+        self._since_train = 0
+        if self._sample_count < 10:  # Train only when enough data is available
+            return
+
+        count = min(self.batch_size, self._sample_count)
+        if count == self.history:
+            inputs, labels = self._sample_features, self._sample_labels  # Whole ring, no copy
+        else:
+            newest = (self._sample_next - 1 - np.arange(count)) % self.history
+            inputs, labels = self._sample_features[newest], self._sample_labels[newest]
+
+        # Train the model
+        self.optimizer.zero_grad()
+        predictions = self.perceptron(torch.from_numpy(inputs)).view(-1)
+        loss = self.criterion(predictions, torch.from_numpy(labels))
+        loss.backward()
+        self.optimizer.step()
+        self._refresh_weights()
+
+    def state_dict(self):
+        # The model's torch state dict as plain lists for rl.checkpoint
+        return {"model": {name: tensor.tolist() for name, tensor in self.perceptron.state_dict().items()}}
+
+    def load_state_dict(self, state):
+        model = {name: torch.tensor(values, dtype=torch.float32) for name, values in state["model"].items()}
+        self.perceptron.load_state_dict(model)  # Raises on a feature_size mismatch
+        self._refresh_weights()
+
+    def __contains__(self, key):
+        return key in self.cache
+
+    def invalidate(self, key):
+        # Drop a resident line without counting an eviction (e.g. back-invalidation)
+        return self.cache.pop(key, None) is not None
+
+    def display(self):
+        return f"Cache: {[(key, entry['value']) for key, entry in self.cache.items()]}"
+
+    def print_metrics(self):
+        print(f"False Positives: {self.false_positives}")
+        print(f"False Negatives: {self.false_negatives}")
+
+
+if __name__ == "__main__":
+    adaptive_cache = AdaptiveCache(capacity=64, feature_size=3)
+
+    # Simulate access to cache; the model trains itself every train_every accesses
+    trace_file = "traces/all_policy_trace"
+    for address in iter_trace_addresses(trace_file):
+        adaptive_cache.access(address)
+
+    # Output the metrics (false positives, false negatives)
+    adaptive_cache.print_metrics()
+
+    adaptive_cache.stats.report(trace_file)
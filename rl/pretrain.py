@@ -0,0 +1,125 @@
+import argparse
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from cache.registry import POLICIES, STOCHASTIC_POLICIES, policy_class
+from rl.checkpoint import merge_state_dicts, save_checkpoint
+from sim.sweep import build_cache, replay
+from sim.trace_format import BINARY_SUFFIX, ensure_binary, load_trace
+
+# Offline pretraining: train each learned policy on every trace of a corpus in parallel,
+# then reduce the per-trace states to one warm-start file that sim.sweep and main.py load
+# through the "warm_start" parameter. Q-tables (and epsilon) are averaged, weighted by
+# trace length: each entry estimates the same state-action value. Weights of independently
+# trained models have no such correspondence, so for every other policy the trained state
+# with the lowest miss rate over the validation traces is kept.
+LEARNED_POLICIES = ("RL_SingleQ", "RL_DoubleQ", "Perceptron", "RL_DQN")
+AVERAGED_POLICIES = ("RL_SingleQ", "RL_DoubleQ")
+DEFAULT_OUTPUT = "warm_start.json"
+
+
+def pretrain_job(job):
+    # Worker entry point: one agent (fresh, or starting from job["state"] when validating)
+    # run over one trace; returns its state and weight
+    random.seed(job["seed"])
+    np.random.seed(job["seed"])
+    labels, addresses = load_trace(job["binary"])
+    cell = {"policy": job["policy"], "capacity": job["capacity"], "geometry": None, "params": job["params"]}
+    cache = build_cache(cell)
+    if job.get("state") is not None:
+        cache.load_state_dict(job["state"])
+    replay(cache, labels, addresses)
+    return cache.state_dict(), len(addresses), cache.stats.miss_rate
+
+
+def _run_jobs(pool, jobs, stage, start, progress):
+    # Yield (job, (state, accesses, miss_rate)) in job order
+    for done, (job, result) in enumerate(zip(jobs, pool.map(pretrain_job, jobs)), 1):
+        if progress:
+            print(f"[{stage} {done}/{len(jobs)}] {job['policy']} {job['trace']} capacity {job['capacity']}: "
+                  f"miss rate {result[2] * 100:.2f}% ({time.perf_counter() - start:.1f}s)")
+        yield job, result
+
+
+def pretrain(traces, policies=LEARNED_POLICIES, capacities=(64,), params=None, seed=0, workers=None, progress=True,
+             validation=None):
+    # Returns policy name -> warm-start state; validation traces default to the training corpus
+    params = params or {}
+    validation = validation or traces
+    for policy in policies:
+        if not hasattr(policy_class(policy), "state_dict"):
+            raise ValueError(f"{policy} has no learned state to pretrain")
+    binary = {trace: trace if trace.endswith(BINARY_SUFFIX) else ensure_binary(trace)
+              for trace in dict.fromkeys(list(traces) + list(validation))}
+
+    def make_job(policy, trace, capacity, state=None):
+        return {"policy": policy, "trace": trace, "binary": binary[trace], "capacity": capacity,
+                "params": params.get(policy, {}), "seed": seed if policy in STOCHASTIC_POLICIES else 0,
+                "state": state}
+
+    jobs = [make_job(policy, trace, capacity) for policy in policies for trace in traces for capacity in capacities]
+    results = {policy: [] for policy in policies}  # policy -> [(training job, state, accesses)]
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for job, (state, accesses, _) in _run_jobs(pool, jobs, "train", start, progress):
+            results[job["policy"]].append((job, state, accesses))
+
+        # Candidates of the non-averaged policies each replay every validation trace
+        checks = [dict(make_job(policy, trace, capacity, state), candidate=index)
+                  for policy in policies if policy not in AVERAGED_POLICIES
+                  for index, (_, state, _) in enumerate(results[policy])
+                  for trace in validation for capacity in capacities]
+        scores = {}  # (policy, candidate) -> [misses, accesses]
+        for check, (_, accesses, miss_rate) in _run_jobs(pool, checks, "validate", start, progress):
+            score = scores.setdefault((check["policy"], check["candidate"]), [0.0, 0])
+            score[0] += miss_rate * accesses
+            score[1] += accesses
+
+    reduced = {}
+    for policy, trained in results.items():
+        if policy in AVERAGED_POLICIES:
+            reduced[policy] = merge_state_dicts([state for _, state, _ in trained], [accesses for _, _, accesses in trained])
+            continue
+        rates = [scores[policy, index][0] / scores[policy, index][1] for index in range(len(trained))]
+        best = min(range(len(trained)), key=rates.__getitem__)
+        job, reduced[policy], _ = trained[best]
+        if progress:
+            print(f"{policy}: keeping the state trained on {job['trace']} capacity {job['capacity']} "
+                  f"(validation miss rate {rates[best] * 100:.2f}%)")
+    return reduced
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pretrain the learned policies on a trace corpus")
+    parser.add_argument("traces", nargs="*", help="Traces to train on (default: every trace in traces/)")
+    parser.add_argument("-o", "--output", default=DEFAULT_OUTPUT, help=f"Warm-start file (default: {DEFAULT_OUTPUT})")
+    parser.add_argument("--policy", action="append", choices=LEARNED_POLICIES, help="Policy to train (repeatable)")
+    parser.add_argument("--capacity", type=int, action="append", help="Capacity to train at (repeatable, default 64)")
+    parser.add_argument("--params", default="{}", help='JSON policy -> constructor arguments, e.g. {"RL_DoubleQ": {"features": true}}')
+    parser.add_argument("--validate", action="append",
+                        help="Trace that scores the non-averaged policies' candidates (repeatable, default: the training traces)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-j", "--workers", type=int, default=None, help="Worker processes (default: all cores)")
+    args = parser.parse_args()
+
+    traces = args.traces or sorted(
+        os.path.join("traces", name) for name in os.listdir("traces")
+        if not name.startswith(".") and not name.endswith(BINARY_SUFFIX)
+    )
+    policies = args.policy or list(LEARNED_POLICIES)
+    capacities = args.capacity or [64]
+    params = json.loads(args.params)
+    unknown = set(params) - set(POLICIES)
+    if unknown:
+        raise ValueError(f"Unknown policies in --params: {sorted(unknown)}")
+
+    validation = args.validate or traces
+    states = pretrain(traces, policies, capacities, params, args.seed, args.workers, validation=validation)
+    save_checkpoint(args.output, states, traces=traces, validation=validation, capacities=capacities,
+                    params=params, seed=args.seed)
+    print(f"Saved warm-start state for {', '.join(states)} to {args.output}")
@@ -0,0 +1,150 @@
+import random
+
+import numpy as np
+
+from cache.resident_set import ResidentSet
+from cache.shadow import ShadowCaches
+from cache.stats import AccessOutcome, CacheStats
+
+
+class RLAdaptiveCache:
+    def __init__(self, capacity, threshold=3, epsilon=0.1, alpha=0.1, gamma=0.9, epsilon_decay=0.995,
+                 shadow=False, extra_policies=(), verbose=False, log_every=0):
+        self.capacity = capacity
+        self.threshold = threshold
+        self.epsilon = epsilon  # Initial exploration rate
+        self.alpha = alpha  # Learning rate
+        self.gamma = gamma  # Discount factor
+        self.epsilon_decay = epsilon_decay  # Epsilon decay factor for reducing exploration
+        self.resident = ResidentSet(capacity, extra_policies)  # Shared lines with LRU and FIFO metadata
+        self.policies = ("LRU", "FIFO") + tuple(extra_policies)  # Action i evicts by policies[i]
+        self.mode = "LRU"  # Start with LRU
+        self.miss_count = 0  # Misses since the last mode switch
+        self.verbose = verbose  # Return descriptive strings and log decisions
+        self.stats = CacheStats(log_every=log_every or int(verbose))
+        self.last_outcome = None  # AccessOutcome of the most recent access
+        # Optional ghost caches: every action is rewarded from its own counterfactual outcome
+        self.shadow = ShadowCaches(capacity, self.policies) if shadow else None
+
+        # Q-table: one state per current policy (LRU, FIFO, ...), one action per policy to evict by
+        self.q_table = np.zeros((len(self.policies), len(self.policies)))
+        self.state = 0  # Initial state: LRU (0)
+
+    @property
+    def total_miss_count(self):
+        return self.stats.misses
+
+    @property
+    def total_count(self):
+        return self.stats.accesses
+
+    def access(self, key, value=None, access_type=None):
+        # Select action using epsilon-greedy policy
+        action = self._choose_action()
+
+        # Action 0 evicts by LRU order, action 1 by FIFO order, then any extra policies
+        outcome = self._access(key, value, self.policies[action])
+        outcome.access_type = access_type
+        self.last_outcome = outcome
+
+        # Adapt based on miss count
+        if self.miss_count > self.threshold:
+            self._switch_mode()
+
+        # Update Q-table based on reward
+        if self.shadow is None:
+            reward = self._get_reward(outcome)
+            self._update_q_table(reward, action)
+        else:
+            for shadow_action, shadow_hit in enumerate(self.shadow.access(key)):
+                self._update_q_table(1 if shadow_hit else -1, shadow_action)
+
+        # Decay epsilon after each access to gradually reduce exploration
+        self.epsilon = max(self.epsilon * self.epsilon_decay, 0.01)
+
+        if self.verbose:
+            return f"Cache {'hit' if outcome.hit else 'miss'} ({outcome.policy}): {key} -> {value}"
+        return outcome.hit
+
+    def _choose_action(self):
+        # Epsilon-greedy action selection; with shadows every action is evaluated anyway
+        if self.shadow is not None:
+            return np.argmax(self.q_table[self.state])
+        if random.uniform(0, 1) < self.epsilon:
+            action = random.randrange(len(self.policies))  # Random action
+            if self.verbose:
+                print(f"Random action chosen: {action}")
+        else:
+            action = np.argmax(self.q_table[self.state])  # Select best action from Q-table
+            if self.verbose:
+                print(f"Best action chosen from Q-table: {action}")
+        return action
+
+    def _access(self, key, value, policy):
+        resident = self.resident
+        if key in resident:
+            resident.hit(key)
+            self.stats.hits += 1
+            return AccessOutcome(True, policy)
+        self.miss_count += 1
+        self.stats.misses += 1
+        evicted_key = None
+        if resident.is_full():
+            evicted_key, evicted_value = resident.evict(policy)
+            self.stats.record_eviction(policy, evicted_key, evicted_value)
+        resident.insert(key, value)
+        return AccessOutcome(False, policy, evicted_key)
+
+    def _switch_mode(self):
+        # The resident set already carries every policy's order, so switching only changes the mode
+        if self.miss_count >= self.threshold:  # Ensure threshold is met before switching
+            if self.shadow is not None:
+                # Follow the policy the counterfactual rewards rate highest, which may be the current one
+                state = int(np.argmax(self.q_table[self.state]))
+            else:
+                # Rotate to the next policy (LRU <-> FIFO without extra policies)
+                state = (self.state + 1) % len(self.policies)
+            mode = self.policies[state]
+            if self.verbose and mode != self.mode:
+                print(f"Switching to {mode} mode...")
+            self.mode = mode
+            self.state = state
+            self.miss_count = 0  # Reset miss count after switching
+
+    def _get_reward(self, outcome):
+        if outcome.hit:
+            return 1  # Positive reward for cache hit
+        else:
+            return -1  # Negative reward for cache miss
+
+    def _update_q_table(self, reward, action):
+        # Update Q-table using Q-learning formula
+        best_next_action = np.argmax(self.q_table[self.state])
+        self.q_table[self.state, action] = self.q_table[self.state, action] + self.alpha * (
+                reward + self.gamma * self.q_table[self.state, best_next_action] - self.q_table[self.state, action]
+        )
+
+    def state_dict(self):
+        # Learned state only (no resident lines), as plain lists for rl.checkpoint
+        return {"policies": list(self.policies), "q_table": self.q_table.tolist(), "epsilon": self.epsilon}
+
+    def load_state_dict(self, state):
+        if list(state["policies"]) != list(self.policies):
+            raise ValueError(f"State is for policies {state['policies']}, this cache uses {list(self.policies)}")
+        self.q_table = np.array(state["q_table"], dtype=float).reshape(self.q_table.shape)
+        self.epsilon = state["epsilon"]
+
+    def __contains__(self, key):
+        return key in self.resident
+
+    def invalidate(self, key):
+        # Drop a resident line without counting an eviction (e.g. back-invalidation)
+        if self.shadow is not None:
+            self.shadow.invalidate(key)
+        if key in self.resident:
+            self.resident.remove(key)
+            return True
+        return False
+
+    def display(self):
+        return f"Cache ({self.mode}): {self.resident.items(self.mode)}"
@@ -0,0 +1,161 @@
+IFETCH = 2  # Dinero label for instruction fetches
+REUSE_BUCKETS = 32  # log2 reuse-time buckets; bucket b holds reuse times in [2**(b-1), 2**b)
+
+
+class WorkloadFeatures:
+    # Sliding-window workload statistics for the RL state. Every statistic is kept as a
+    # running sum over a ring of the last `window` accesses, so record() is O(1) and the
+    # discretised state() only reads the sums.
+    #   hit rate      - hits in the window
+    #   working set   - distinct keys in the window
+    #   reuse sketch  - log2 histogram of reuse times, last use looked up in a hashed table
+    #   stride        - accesses repeating the previous address delta (strided streams)
+    #   I/D mix       - instruction fetches in the window (from the trace label)
+    HIT_LEVELS = 3
+    WORKING_SET_LEVELS = 3
+    REUSE_LEVELS = 3
+    STRIDE_LEVELS = 2
+    MIX_LEVELS = 2
+    num_states = HIT_LEVELS * WORKING_SET_LEVELS * REUSE_LEVELS * STRIDE_LEVELS * MIX_LEVELS
+
+    def __init__(self, capacity, window=1024, sketch_bits=16):
+        if window < 1:
+            raise ValueError(f"window must be at least 1, got {window}")
+        self.capacity = capacity
+        self.window = window
+        self.clock = 0
+        self.pos = 0  # Ring slot the next access overwrites
+        self.count = 0  # Accesses currently in the window
+
+        # Per-slot contributions, subtracted again when the slot slides out
+        self._hits = [0] * window
+        self._keys = [None] * window
+        self._reuse = [-1] * window  # Reuse bucket, -1 for a first touch
+        self._strided = [0] * window
+        self._ifetch = [0] * window
+
+        self.hit_sum = 0
+        self.strided_sum = 0
+        self.ifetch_sum = 0
+        self.key_counts = {}  # Key -> occurrences in the window
+        self.reuse_histogram = [0] * REUSE_BUCKETS
+
+        self._mask = (1 << sketch_bits) - 1
+        self._last_seen = [-1] * (1 << sketch_bits)  # Hashed key -> clock of last access
+        self.last_key = None
+        self.stride = 0
+
+    def record(self, key, hit, access_type=None):
+        slot = self.pos
+        if self.count == self.window:
+            self.hit_sum -= self._hits[slot]
+            self.strided_sum -= self._strided[slot]
+            self.ifetch_sum -= self._ifetch[slot]
+            old_key = self._keys[slot]
+            remaining = self.key_counts[old_key] - 1
+            if remaining:
+                self.key_counts[old_key] = remaining
+            else:
+                del self.key_counts[old_key]
+            if self._reuse[slot] >= 0:
+                self.reuse_histogram[self._reuse[slot]] -= 1
+        else:
+            self.count += 1
+
+        hit = 1 if hit else 0
+        self._hits[slot] = hit
+        self.hit_sum += hit
+
+        self._keys[slot] = key
+        self.key_counts[key] = self.key_counts.get(key, 0) + 1
+
+        # Collisions in the hashed table only make the sketch see spurious short reuses
+        index = hash(key) & self._mask
+        last = self._last_seen[index]
+        self._last_seen[index] = self.clock
+        if last >= 0:
+            bucket = min((self.clock - last).bit_length(), REUSE_BUCKETS - 1)
+            self.reuse_histogram[bucket] += 1
+        else:
+            bucket = -1
+        self._reuse[slot] = bucket
+
+        strided = 0
+        if type(key) is int and self.last_key is not None:
+            stride = key - self.last_key
+            strided = 1 if stride and stride == self.stride else 0
+            self.stride = stride
+        self.last_key = key
+        self._strided[slot] = strided
+        self.strided_sum += strided
+
+        ifetch = 1 if access_type == IFETCH else 0
+        self._ifetch[slot] = ifetch
+        self.ifetch_sum += ifetch
+
+        self.clock += 1
+        self.pos = slot + 1 if slot + 1 < self.window else 0
+
+    @property
+    def hit_rate(self):
+        return self.hit_sum / self.count if self.count else 0
+
+    @property
+    def working_set(self):
+        return len(self.key_counts)
+
+    @property
+    def short_reuse_fraction(self):
+        # Accesses reused within about `capacity` accesses (log2 buckets, so up to 2x over)
+        if not self.count:
+            return 0
+        fits = self.capacity.bit_length()
+        return sum(self.reuse_histogram[:fits + 1]) / self.count
+
+    @property
+    def stride_fraction(self):
+        return self.strided_sum / self.count if self.count else 0
+
+    @property
+    def ifetch_fraction(self):
+        return self.ifetch_sum / self.count if self.count else 0
+
+    def vector(self):
+        # The window's statistics as floats in [0, 1], for learners that take real-valued inputs
+        return [
+            self.hit_rate,
+            min(self.working_set / (4 * self.capacity), 1.0),
+            self.short_reuse_fraction,
+            self.stride_fraction,
+            self.ifetch_fraction,
+        ]
+
+    def state(self):
+        # Discretise the window into one of num_states workload buckets
+        hit_level = min(int(self.hit_rate * self.HIT_LEVELS), self.HIT_LEVELS - 1)
+        working_set = self.working_set
+        if working_set <= self.capacity:
+            working_set_level = 0
+        elif working_set <= 4 * self.capacity:
+            working_set_level = 1
+        else:
+            working_set_level = 2
+        reuse_level = min(int(self.short_reuse_fraction * self.REUSE_LEVELS), self.REUSE_LEVELS - 1)
+        stride_level = 1 if self.stride_fraction > 0.5 else 0
+        mix_level = 1 if self.ifetch_fraction > 0.5 else 0
+
+        state = hit_level
+        state = state * self.WORKING_SET_LEVELS + working_set_level
+        state = state * self.REUSE_LEVELS + reuse_level
+        state = state * self.STRIDE_LEVELS + stride_level
+        return state * self.MIX_LEVELS + mix_level
+
+    def as_dict(self):
+        return {
+            "hit_rate": self.hit_rate,
+            "working_set": self.working_set,
+            "short_reuse_fraction": self.short_reuse_fraction,
+            "stride_fraction": self.stride_fraction,
+            "ifetch_fraction": self.ifetch_fraction,
+            "stride": self.stride,
+        }
@@ -0,0 +1 @@
+# Trace I/O, offline analysis (stack distances) and parameter sweeps
@@ -0,0 +1,118 @@
+import hashlib
+import json
+import os
+import sqlite3
+import time
+
+from sim.trace_format import BINARY_SUFFIX
+
+DEFAULT_PATH = "results/result_cache.sqlite"
+# Parameters naming a file a cell reads; its checksum joins the key so rewriting the file
+# invalidates results computed from the old contents
+FILE_PARAMS = ("warm_start", "train_trace")
+
+_checksums = {}  # (path, size, mtime_ns) -> sha256, so a trace is hashed once per process
+
+
+def trace_checksum(path):
+    if not os.path.exists(path) and os.path.exists(path + BINARY_SUFFIX):
+        path += BINARY_SUFFIX  # Binary-only trace named by its text path
+    stat = os.stat(path)
+    memo_key = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+    checksum = _checksums.get(memo_key)
+    if checksum is None:
+        digest = hashlib.sha256()
+        with open(path, "rb") as fp:
+            for block in iter(lambda: fp.read(1 << 20), b""):
+                digest.update(block)
+        checksum = _checksums[memo_key] = digest.hexdigest()
+    return checksum
+
+
+class ResultStore:
+    # Content-addressed cache of simulation results. A result is keyed by the trace's
+    # checksum (not its path) plus policy, capacity, geometry, hyperparameters and the
+    # seed, so renaming a trace keeps its results and editing it invalidates them.
+    # The store holds at most max_entries rows; the least recently used rows go first.
+    def __init__(self, path=DEFAULT_PATH, max_entries=100000):
+        self.path = path
+        self.max_entries = max_entries
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.db = sqlite3.connect(path)
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            " key TEXT PRIMARY KEY, trace_hash TEXT, policy TEXT, capacity INTEGER,"
+            " geometry TEXT, params TEXT, seed INTEGER, result TEXT,"
+            " created REAL, last_used REAL)"
+        )
+        self.db.execute("CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used)")
+        self.db.commit()
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self.db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    @staticmethod
+    def _config(cell, trace_hash):
+        params = cell.get("params", {})
+        config = {
+            "trace": trace_hash,
+            "policy": cell["policy"],
+            "capacity": cell["capacity"],
+            "geometry": cell.get("geometry"),
+            "params": params,
+            "seed": cell.get("seed"),
+        }
+        files = {name: trace_checksum(params[name]) for name in FILE_PARAMS if params.get(name) is not None}
+        if files:
+            config["files"] = files  # Absent otherwise, so keys of file-free cells are unchanged
+        return config
+
+    def key(self, cell, trace_hash=None):
+        if trace_hash is None:
+            trace_hash = trace_checksum(cell["trace"])
+        config = json.dumps(self._config(cell, trace_hash), sort_keys=True)
+        return hashlib.sha256(config.encode()).hexdigest()
+
+    def get(self, cell, trace_hash=None):
+        key = self.key(cell, trace_hash)
+        row = self.db.execute("SELECT result FROM results WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        self.db.execute("UPDATE results SET last_used = ? WHERE key = ?", (time.time(), key))
+        self.db.commit()
+        return json.loads(row[0])
+
+    def put(self, cell, result, trace_hash=None):
+        if trace_hash is None:
+            trace_hash = trace_checksum(cell["trace"])
+        config = self._config(cell, trace_hash)
+        now = time.time()
+        self.db.execute(
+            "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (self.key(cell, trace_hash), trace_hash, config["policy"], config["capacity"],
+             json.dumps(config["geometry"], sort_keys=True), json.dumps(config["params"], sort_keys=True),
+             config["seed"], json.dumps(result), now, now),
+        )
+        self._evict()
+        self.db.commit()
+
+    def _evict(self):
+        excess = len(self) - self.max_entries
+        if excess > 0:
+            self.db.execute(
+                "DELETE FROM results WHERE key IN (SELECT key FROM results ORDER BY last_used LIMIT ?)",
+                (excess,),
+            )
+
+    def clear(self):
+        self.db.execute("DELETE FROM results")
+        self.db.commit()
@@ -0,0 +1,96 @@
+import sys
+
+import numpy as np
+
+from sim.trace_format import load_trace
+
+# Mattson stack-distance analysis: one pass over a trace yields the exact LRU
+# miss count for every capacity at once. The stack distance of a reference is
+# the number of distinct addresses touched since the previous reference to the
+# same address; under LRU it hits in a cache of capacity C iff distance < C.
+COLD = -1  # Distance recorded for first references (compulsory misses)
+
+
+def previous_use(addresses):
+    # Index of the previous reference to the same address, -1 if none (vectorized)
+    addresses = np.asarray(addresses)
+    order = np.argsort(addresses, kind="stable")
+    ordered = addresses[order]
+    same = ordered[1:] == ordered[:-1]
+    prev = np.full(len(addresses), -1, dtype=np.int64)
+    prev[order[1:][same]] = order[:-1][same]
+    return prev
+
+
+def lru_stack_distances(addresses):
+    # Fenwick tree over time positions; a position is marked while it holds the most
+    # recent reference to its address, so distinct addresses since p = marks after p.
+    # O(N log N) time, one int64 per reference of memory.
+    prev = previous_use(addresses).tolist()
+    n = len(prev)
+    tree = [0] * (n + 1)
+    distances = [COLD] * n
+    distinct = 0
+
+    for i, p in enumerate(prev):
+        if p < 0:
+            distinct += 1
+        else:
+            # Marks in (p, i) = all marks so far - marks in [0, p]
+            marked = 0
+            j = p + 1
+            while j > 0:
+                marked += tree[j]
+                j -= j & -j
+            distances[i] = distinct - marked
+            # The previous reference is no longer the most recent one
+            j = p + 1
+            while j <= n:
+                tree[j] -= 1
+                j += j & -j
+        j = i + 1
+        while j <= n:
+            tree[j] += 1
+            j += j & -j
+
+    return np.array(distances, dtype=np.int64)
+
+
+def lru_miss_counts(addresses=None, capacities=None, distances=None):
+    # Exact LRU misses for each capacity; pass precomputed distances to reuse a pass
+    if distances is None:
+        distances = lru_stack_distances(addresses)
+    cold = int(np.count_nonzero(distances == COLD))
+    warm = distances[distances != COLD]
+    if capacities is None:
+        capacities = np.arange(1, (warm.max() + 2 if len(warm) else 2))
+    capacities = np.asarray(capacities, dtype=np.int64)
+
+    # Reuses at distance >= C miss in a cache of capacity C
+    histogram = np.bincount(warm, minlength=int(capacities.max()) + 1)
+    reuses_below = np.concatenate(([0], np.cumsum(histogram)))
+    hits = reuses_below[np.minimum(capacities, len(histogram))]
+    return cold + len(warm) - hits
+
+
+def miss_ratio_curve(addresses, max_capacity=None):
+    # Full LRU miss-ratio curve: (capacities 1..max_capacity, miss ratios)
+    distances = lru_stack_distances(addresses)
+    if max_capacity is None:
+        max_capacity = max(int(distances.max()) + 1, 1) if len(distances) else 0
+    capacities = np.arange(1, max_capacity + 1)
+    if not len(capacities):
+        return capacities, np.zeros(0)  # Empty trace: empty curve
+    misses = lru_miss_counts(capacities=capacities, distances=distances)
+    return capacities, misses / max(len(distances), 1)
+
+
+if __name__ == "__main__":
+    trace_file = sys.argv[1] if len(sys.argv) > 1 else "traces/all_policy_trace"
+    capacities = [8, 16, 32, 64, 128, 256]
+    labels, addresses = load_trace(trace_file)
+    misses = lru_miss_counts(addresses, capacities)
+
+    print(f"{trace_file}")
+    for capacity, count in zip(capacities, misses.tolist()):
+        print(f"LRU capacity {capacity}: {count} misses ({count / len(addresses) * 100:.2f}%)")
@@ -0,0 +1,217 @@
+import argparse
+import csv
+import inspect
+import itertools
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from cache.belady import BeladyCache
+from cache.geometry import CacheGeometry, SetAssociativeCache
+from cache.registry import STOCHASTIC_POLICIES, policy_class
+from rl.checkpoint import load_checkpoint
+from sim.result_store import DEFAULT_PATH, ResultStore, trace_checksum
+from sim.trace_format import BINARY_SUFFIX, ensure_binary, iter_addresses, load_trace
+
+# Reproduces the hand-run experiments behind plots/*.py
+DEFAULT_GRID = {
+    "traces": ["traces/all_policy_trace"],
+    "policies": ["OPT", "LRU", "FIFO", "LFU", "RL_DoubleQ", "Perceptron"],
+    "capacities": [8, 16, 32, 64, 128, 256],
+    "params": {"RL_DoubleQ": {"threshold": [1, 2, 4, 8, 16]}},
+    "geometries": [None],
+    "seeds": [0],
+}
+
+FIELDS = ["trace", "policy", "capacity", "geometry", "params", "seed", "offline",
+          "accesses", "hits", "misses", "evictions", "miss_rate", "wall_time"]
+
+
+def expand_grid(grid):
+    # Cartesian product of the grid; per-policy hyperparameters expand only that policy
+    cells = []
+    seen = set()
+    for trace, policy, capacity, geometry, seed in itertools.product(
+            grid["traces"], grid["policies"], grid["capacities"],
+            grid.get("geometries", [None]), grid.get("seeds", [0])):
+        if policy not in STOCHASTIC_POLICIES:
+            seed = None
+        space = grid.get("params", {}).get(policy, {})
+        names = sorted(space)
+        for values in itertools.product(*(space[name] for name in names)):
+            identity = json.dumps([trace, policy, capacity, geometry, names, values, seed], sort_keys=True)
+            if identity in seen:
+                continue
+            seen.add(identity)
+            cells.append({
+                "trace": trace,
+                "policy": policy,
+                "capacity": capacity,
+                "geometry": geometry,
+                "params": dict(zip(names, values)),
+                "seed": seed,
+            })
+    return cells
+
+
+def build_cache(cell):
+    cls = policy_class(cell["policy"])
+    params = dict(cell["params"])
+    # A "warm_start" parameter names an rl.checkpoint file to load learned state from
+    warm_start_path = params.pop("warm_start", None)
+    state = load_checkpoint(warm_start_path)["agents"].get(cell["policy"]) if warm_start_path else None
+
+    def make(capacity, **extra):
+        cache = cls(capacity, **extra, **params)
+        if state is not None:
+            cache.load_state_dict(state)
+        return cache
+
+    geometry = cell["geometry"]
+    if geometry is None:
+        return make(cell["capacity"])
+    # A train_trace is split into sets like the replayed trace, not given whole to every set
+    train_trace = None if getattr(cls, "offline", False) else params.pop("train_trace", None)
+    # Geometry cells: capacity counts lines, split across sets of `associativity` ways
+    associativity = geometry["associativity"]
+    shape = CacheGeometry(geometry["line_size"], cell["capacity"] // associativity, associativity)
+    if getattr(cls, "offline", False):
+        # Offline oracles see the whole trace and split it into sets themselves
+        return make(cell["capacity"], geometry=shape)
+    cache = SetAssociativeCache(shape, make)
+    if train_trace is not None:
+        cache.fit(*load_trace(train_trace))
+    return cache
+
+
+def replay(cache, labels, addresses):
+    # Feed a memory-mapped trace through any cache built by build_cache
+    if getattr(cache, "trained", True) is False:
+        # OPT-trained predictors given no train_trace learn from the trace they replay
+        cache.fit(labels, addresses)
+    if isinstance(cache, (SetAssociativeCache, BeladyCache)):
+        cache.run(addresses)
+    elif "access_type" in inspect.signature(cache.access).parameters:
+        # Adaptive policies also see the Dinero access type of each reference
+        access = cache.access
+        for label, address in zip(iter_addresses(labels), iter_addresses(addresses)):
+            access(address, access_type=label)
+    else:
+        access = cache.access
+        for address in iter_addresses(addresses):
+            access(address)
+
+
+def run_cell(cell, trace_path=None):
+    # Worker entry point: the trace is memory-mapped, so every worker shares the same
+    # page-cache copy and nothing but the small cell dict crosses the process boundary.
+    seed = cell["seed"] or 0
+    random.seed(seed)
+    np.random.seed(seed)
+    labels, addresses = load_trace(trace_path or cell["trace"])
+    cache = build_cache(cell)
+    # Offline rows saw the trace they are scored on: OPT, and predictors fit on it by replay()
+    offline = bool(getattr(cache, "offline", False) or getattr(cache, "trained", True) is False)
+
+    start = time.perf_counter()
+    replay(cache, labels, addresses)
+    wall_time = time.perf_counter() - start
+
+    stats = cache.stats
+    return {
+        "trace": cell["trace"],
+        "policy": cell["policy"],
+        "capacity": cell["capacity"],
+        "geometry": json.dumps(cell["geometry"], sort_keys=True),
+        "params": json.dumps(cell["params"], sort_keys=True),
+        "seed": cell["seed"],
+        "offline": offline,
+        "accesses": stats.accesses,
+        "hits": stats.hits,
+        "misses": stats.misses,
+        "evictions": stats.evictions,
+        "miss_rate": stats.miss_rate,
+        "wall_time": wall_time,
+    }
+
+
+def _run_pending(pending, binary, workers):
+    # Yield (cell, row) as cells finish; workers=0 runs in-process (no pool to bootstrap)
+    if workers == 0:
+        for cell in pending:
+            yield cell, run_cell(cell, binary[cell["trace"]])
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(run_cell, cell, binary[cell["trace"]]): cell for cell in pending}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+
+def run_sweep(grid, workers=None, progress=True, store=None):
+    # Cells already in the result store are reused; only the rest are simulated
+    cells = expand_grid(grid)
+    checksums = {trace: trace_checksum(trace) for trace in grid["traces"]}
+
+    rows = []
+    pending = []
+    for cell in cells:
+        cached = store.get(cell, checksums[cell["trace"]]) if store is not None else None
+        if cached is not None:
+            rows.append(dict(cached, trace=cell["trace"]))
+        else:
+            pending.append(cell)
+    if progress and store is not None:
+        print(f"{len(cells) - len(pending)} of {len(cells)} cells found in {store.path}")
+
+    if pending:
+        # Convert text traces once up front so workers never race on the .bin file
+        binary = {trace: trace if trace.endswith(BINARY_SUFFIX) else ensure_binary(trace)
+                  for trace in {cell["trace"] for cell in pending}}
+        for done, (cell, row) in enumerate(_run_pending(pending, binary, workers), 1):
+            rows.append(row)
+            if store is not None:
+                store.put(cell, row, checksums[cell["trace"]])
+            if progress:
+                print(f"[{done}/{len(pending)}] {row['trace']} {row['policy']} {row['capacity']} "
+                      f"{row['params']}: {row['misses']} misses ({row['wall_time']:.2f}s)")
+    rows.sort(key=lambda row: (row["trace"], row["policy"], row["capacity"], row["geometry"], row["params"], row["seed"] or 0))
+    return rows
+
+
+def write_results(rows, path):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    if path.endswith(".parquet"):
+        try:
+            import pandas as pd
+        except ImportError:
+            raise ImportError("Writing Parquet requires pandas (and pyarrow); use a .csv path instead")
+        pd.DataFrame(rows, columns=FIELDS).to_parquet(path, index=False)
+        return
+    with open(path, "w", newline="") as fp:
+        writer = csv.DictWriter(fp, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run a (trace x policy x capacity x hyperparameter) sweep")
+    parser.add_argument("grid", nargs="?", help="JSON grid spec (defaults to the plots/ experiments)")
+    parser.add_argument("-o", "--output", default="results/sweep.csv", help="CSV or Parquet output path")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="Worker processes (default: all cores, 0: in-process)")
+    parser.add_argument("--store", default=DEFAULT_PATH, help="Result store used to skip computed cells")
+    parser.add_argument("--no-store", action="store_true", help="Recompute every cell")
+    args = parser.parse_args()
+
+    grid = DEFAULT_GRID
+    if args.grid:
+        with open(args.grid) as fp:
+            grid = {**DEFAULT_GRID, **json.load(fp)}
+
+    store = None if args.no_store else ResultStore(args.store)
+    results = run_sweep(grid, workers=args.workers, store=store)
+    write_results(results, args.output)
+    print(f"Wrote {len(results)} rows to {args.output}")
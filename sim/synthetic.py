@@ -0,0 +1,208 @@
+import argparse
+import json
+import os
+
+import numpy as np
+
+from sim.trace_format import BINARY_SUFFIX, create_binary, format_text
+
+# Synthetic `<label> <hexaddr>` traces at arbitrary length. Every pattern is generated a
+# chunk at a time with NumPy, and chunks go straight to disk, so memory stays bounded by
+# the chunk size whatever the trace length.
+#
+# A workload is a list of phases, cycled until the requested length. Each phase mixes one
+# or more tenants; a tenant is an access pattern over its own address region:
+#   {"length": 1000000, "tenants": [{"pattern": "zipf", "footprint": 65536, "alpha": 1.0, "weight": 3},
+#                                   {"pattern": "scan", "weight": 1}]}
+# A tenant keeps its position across phases, so a phase that comes back resumes its working set.
+PATTERNS = ("zipf", "uniform", "scan", "loop", "stride")
+CHUNK_SIZE = 1 << 20
+READ, WRITE, IFETCH = 0, 1, 2
+CODE_BASE = 0x04000000  # Where Valgrind maps program text
+DATA_BASE = 0x100000000
+REGION_SIZE = 1 << 40  # Address space per tenant region
+_SCATTER = np.uint64(2654435761)  # Prime multiplier: a bijection on [0, footprint) that spreads hot ranks
+
+PRESETS = {
+    # One phase after another: a skewed hot set, a loop just over a typical cache, then a scan
+    "phased": [
+        {"length": 1 << 20, "tenants": [{"pattern": "zipf", "footprint": 1 << 16, "alpha": 1.0}]},
+        {"length": 1 << 20, "tenants": [{"pattern": "loop", "footprint": 4608}]},
+        {"length": 1 << 19, "tenants": [{"pattern": "scan"}]},
+    ],
+    # Tenants sharing the cache at once
+    "tenants": [
+        {"tenants": [
+            {"pattern": "zipf", "footprint": 1 << 18, "alpha": 0.9, "weight": 4},
+            {"pattern": "loop", "footprint": 2048, "weight": 2},
+            {"pattern": "stride", "footprint": 1 << 16, "stride": 17, "weight": 1},
+            {"pattern": "scan", "weight": 1},
+        ]},
+    ],
+}
+
+
+class _Tenant:
+    def __init__(self, pattern, region, footprint=1 << 16, alpha=1.0, stride=1, weight=1.0):
+        if pattern not in PATTERNS:
+            raise ValueError(f"Unknown pattern: {pattern}, expected one of {PATTERNS}")
+        if not 1 <= footprint < 1 << 32:
+            raise ValueError("footprint must be between 1 and 2**32 - 1 lines")
+        if weight <= 0:
+            raise ValueError("weight must be positive")
+        self.pattern = pattern
+        self.region = region
+        self.footprint = int(footprint)
+        self.alpha = float(alpha)
+        self.stride = int(stride)
+        self.weight = float(weight)
+        self.position = 0  # References issued so far, for the positional patterns
+
+    def take(self, count, rng):
+        # Next `count` line numbers within the tenant's region
+        positions = np.arange(self.position, self.position + count, dtype=np.uint64)
+        self.position += count
+        footprint = np.uint64(self.footprint)
+        if self.pattern == "scan":
+            return positions  # Never reused
+        if self.pattern == "loop":
+            return positions % footprint
+        if self.pattern == "stride":
+            return (positions * np.uint64(self.stride)) % footprint
+        if self.pattern == "uniform":
+            return rng.integers(0, self.footprint, count, dtype=np.uint64)
+        return (self._zipf_ranks(count, rng) * _SCATTER) % footprint
+
+    def _zipf_ranks(self, count, rng):
+        # Bounded Zipf by inverse transform of the continuous power law: O(1) memory for any footprint
+        u = rng.random(count)
+        if abs(self.alpha - 1.0) < 1e-9:
+            ranks = np.power(float(self.footprint), u)
+        else:
+            exponent = 1.0 - self.alpha
+            ranks = np.power((self.footprint ** exponent - 1.0) * u + 1.0, 1.0 / exponent)
+        return np.minimum(ranks.astype(np.uint64) - np.uint64(1), np.uint64(self.footprint - 1))
+
+
+def _build_phases(phases):
+    # Every tenant gets a fresh region unless it names one; tenants naming the same region are shared
+    tenants = {}
+    built = []
+    for phase in phases:
+        members = []
+        for options in phase["tenants"]:
+            options = dict(options)
+            region = options.pop("region", None)
+            if region is None:
+                region = max(tenants, default=-1) + 1
+            if region not in tenants:
+                tenants[region] = _Tenant(region=region, **options)
+            members.append(tenants[region])
+        weights = np.array([tenant.weight for tenant in members])
+        built.append((phase.get("length"), members, weights / weights.sum()))
+    return built
+
+
+def generate(phases, length, seed=0, ifetch=0.0, write_ratio=0.3, code_footprint=1024, line_size=64,
+             chunk_size=CHUNK_SIZE):
+    # Yield (uint8 labels, uint64 addresses) chunks totalling `length` references
+    if not 0.0 <= ifetch < 1.0:
+        raise ValueError("ifetch must be in [0, 1)")
+    if not 0.0 <= write_ratio <= 1.0:
+        raise ValueError("write_ratio must be in [0, 1]")
+    rng = np.random.default_rng(seed)
+    built = _build_phases(phases)
+    code = _Tenant("loop", region=None, footprint=code_footprint)
+    line = np.uint64(line_size)
+
+    phase_index = 0
+    phase_left = built[0][0] or length
+    issued = 0
+    while issued < length:
+        count = min(chunk_size, length - issued, phase_left)
+        _, members, weights = built[phase_index]
+
+        # Instruction fetches walk the code loop; the rest are data references
+        labels = np.where(rng.random(count) < write_ratio, WRITE, READ).astype(np.uint8)
+        is_fetch = rng.random(count) < ifetch if ifetch else np.zeros(count, dtype=bool)
+        labels[is_fetch] = IFETCH
+        addresses = np.empty(count, dtype=np.uint64)
+        addresses[is_fetch] = np.uint64(CODE_BASE) + code.take(int(is_fetch.sum()), rng) * line
+
+        data = np.flatnonzero(~is_fetch)
+        owner = rng.choice(len(members), len(data), p=weights) if len(members) > 1 else np.zeros(len(data), dtype=int)
+        for index, tenant in enumerate(members):
+            slots = data[owner == index]
+            base = np.uint64(DATA_BASE + tenant.region * REGION_SIZE)
+            addresses[slots] = base + tenant.take(len(slots), rng) * line
+
+        yield labels, addresses
+        issued += count
+        phase_left -= count
+        if phase_left == 0:
+            phase_index = (phase_index + 1) % len(built)
+            phase_left = built[phase_index][0] or length
+
+
+def write_trace(path, phases, length, binary=True, text=True, **options):
+    # Stream a synthetic trace to `path` (text) and/or `path.bin` (binary layout)
+    if not (binary or text):
+        raise ValueError("Nothing to write: enable text and/or binary output")
+    text_tmp = path + ".tmp"
+    binary_path = path + BINARY_SUFFIX
+    binary_tmp = binary_path + ".tmp"
+    labels_out, addresses_out = create_binary(binary_tmp, length) if binary else (None, None)
+    offset = 0
+    with open(text_tmp if text else os.devnull, "wb") as out:
+        for labels, addresses in generate(phases, length, **options):
+            if text:
+                out.write(format_text(labels, addresses))
+            if binary:
+                labels_out[offset:offset + len(labels)] = labels
+                addresses_out[offset:offset + len(labels)] = addresses
+            offset += len(labels)
+    if text:
+        os.replace(text_tmp, path)
+    if binary:
+        labels_out.flush()
+        addresses_out.flush()
+        del labels_out, addresses_out
+        os.replace(binary_tmp, binary_path)  # After the text file, so ensure_binary sees it as current
+    return path
+
+
+def _count(value):
+    return int(float(value))  # Accepts 1e8
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Write a synthetic Dinero-format trace")
+    parser.add_argument("output", help=f"Text trace path; the binary copy goes to <output>{BINARY_SUFFIX}")
+    parser.add_argument("--length", type=_count, default=1 << 20, help="References to write (e.g. 1e8)")
+    parser.add_argument("--pattern", default="zipf", choices=PATTERNS + tuple(PRESETS),
+                        help="Single-tenant pattern, or a multi-phase/multi-tenant preset")
+    parser.add_argument("--spec", help="JSON file with a list of phases (overrides --pattern)")
+    parser.add_argument("--footprint", type=_count, default=1 << 16, help="Distinct lines per tenant")
+    parser.add_argument("--alpha", type=float, default=1.0, help="Zipf skew")
+    parser.add_argument("--stride", type=int, default=1, help="Stride in lines")
+    parser.add_argument("--ifetch", type=float, default=0.0, help="Fraction of instruction fetches")
+    parser.add_argument("--write-ratio", type=float, default=0.3, help="Fraction of data references that write")
+    parser.add_argument("--code-footprint", type=_count, default=1024, help="Lines in the instruction loop")
+    parser.add_argument("--line-size", type=int, default=64, help="Bytes between consecutive lines (1 for block numbers)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--format", default="both", choices=("text", "binary", "both"))
+    args = parser.parse_args()
+
+    if args.spec:
+        with open(args.spec) as fp:
+            phases = json.load(fp)
+    elif args.pattern in PRESETS:
+        phases = PRESETS[args.pattern]
+    else:
+        phases = [{"tenants": [{"pattern": args.pattern, "footprint": args.footprint,
+                                "alpha": args.alpha, "stride": args.stride}]}]
+
+    write_trace(args.output, phases, args.length, binary=args.format != "text", text=args.format != "binary",
+                seed=args.seed, ifetch=args.ifetch, write_ratio=args.write_ratio,
+                code_footprint=args.code_footprint, line_size=args.line_size)
+    print(f"Wrote {args.length} references to {args.output} ({args.format})")
@@ -0,0 +1,136 @@
+import os
+import shutil
+import sys
+
+import numpy as np
+
+from sim.trace_reader import iter_trace_chunks
+
+# Binary trace layout (little-endian):
+#   16-byte header: magic, format version, number of references
+#   uint8  access-type column (Dinero label: 0 read, 1 write, 2 instruction fetch)
+#   padding up to the next 8-byte boundary
+#   uint64 address column
+MAGIC = b"DTRC"
+VERSION = 1
+HEADER = np.dtype([("magic", "S4"), ("version", "<u4"), ("count", "<u8")])
+BINARY_SUFFIX = ".bin"
+CHUNK_LINES = 1 << 16
+
+
+def _address_offset(count):
+    offset = HEADER.itemsize + count
+    return (offset + 7) & ~7
+
+
+def convert_trace(text_path, binary_path=None):
+    # One-time conversion of a `<label> <hexaddr>` Dinero trace into the binary layout.
+    # Labels go straight into the output file and addresses into a side file, so the
+    # conversion streams in constant memory regardless of trace length.
+    if binary_path is None:
+        binary_path = text_path + BINARY_SUFFIX
+
+    tmp_path = binary_path + ".tmp"
+    addr_path = binary_path + ".addr.tmp"
+    count = 0
+    with open(tmp_path, "wb") as out, open(addr_path, "wb") as addr_out:
+        out.write(b"\0" * HEADER.itemsize)
+        for labels, addresses in iter_trace_chunks(text_path, CHUNK_LINES):
+            out.write(labels.tobytes())
+            addr_out.write(addresses.astype("<u8").tobytes())
+            count += len(labels)
+
+    with open(tmp_path, "r+b") as out, open(addr_path, "rb") as addr_in:
+        out.write(np.array([(MAGIC, VERSION, count)], dtype=HEADER).tobytes())
+        out.seek(0, os.SEEK_END)
+        out.write(b"\0" * (_address_offset(count) - HEADER.itemsize - count))
+        shutil.copyfileobj(addr_in, out)
+    os.remove(addr_path)
+    os.replace(tmp_path, binary_path)
+    return binary_path
+
+
+def create_binary(path, count):
+    # Preallocate a binary trace of `count` references; returns writable (labels, addresses)
+    # memmaps so a producer can fill it chunk by chunk without holding it in memory
+    with open(path, "wb") as out:
+        out.write(np.array([(MAGIC, VERSION, count)], dtype=HEADER).tobytes())
+        out.truncate(_address_offset(count) + 8 * count)
+    if count == 0:
+        return np.empty(0, dtype=np.uint8), np.empty(0, dtype=np.uint64)
+    labels = np.memmap(path, dtype=np.uint8, mode="r+", offset=HEADER.itemsize, shape=(count,))
+    addresses = np.memmap(path, dtype="<u8", mode="r+", offset=_address_offset(count), shape=(count,))
+    return labels, addresses
+
+
+_HEX_DIGITS = np.frombuffer(b"0123456789abcdef", dtype=np.uint8)
+
+
+def format_text(labels, addresses):
+    # Vectorized inverse of parse_chunk: `<label> <hexaddr>` lines as bytes, no leading zeros.
+    # Works on the big-endian bytes of each address so the temporaries stay 16 bytes per line.
+    count = len(addresses)
+    octets = np.asarray(addresses, dtype=">u8").view(np.uint8).reshape(count, 8)
+    nibbles = np.empty((count, 16), dtype=np.uint8)
+    nibbles[:, 0::2] = octets >> 4
+    nibbles[:, 1::2] = octets & 15
+    rows = np.empty((count, 19), dtype=np.uint8)
+    rows[:, 0] = np.asarray(labels, dtype=np.uint8) + ord("0")
+    rows[:, 1] = ord(" ")
+    rows[:, 2:18] = _HEX_DIGITS[nibbles]
+    rows[:, 18] = ord("\n")
+    nonzero = nibbles != 0
+    nonzero[:, -1] = True  # Address 0 still prints one digit
+    keep = np.ones((count, 19), dtype=bool)
+    keep[:, 2:18] = np.arange(16) >= nonzero.argmax(axis=1)[:, None]
+    return rows[keep].tobytes()
+
+
+def ensure_binary(text_path):
+    # Convert on first use (or when the text trace is newer than its binary copy)
+    binary_path = text_path + BINARY_SUFFIX
+    if not os.path.exists(text_path) and os.path.exists(binary_path):
+        return binary_path  # Binary-only trace, e.g. from sim.synthetic --format binary
+    if not os.path.exists(binary_path) or os.path.getmtime(binary_path) < os.path.getmtime(text_path):
+        convert_trace(text_path, binary_path)
+    return binary_path
+
+
+def load_trace(path):
+    # Memory-map a binary trace; returns read-only (labels, addresses) NumPy views
+    if not path.endswith(BINARY_SUFFIX):
+        path = ensure_binary(path)
+
+    header = np.fromfile(path, dtype=HEADER, count=1)
+    if len(header) != 1 or header["magic"][0] != MAGIC:
+        raise ValueError(f"{path} is not a binary trace file")
+    if header["version"][0] != VERSION:
+        raise ValueError(f"{path}: unsupported trace format version {header['version'][0]}")
+
+    count = int(header["count"][0])
+    if count == 0:
+        return np.empty(0, dtype=np.uint8), np.empty(0, dtype=np.uint64)
+    labels = np.memmap(path, dtype=np.uint8, mode="r", offset=HEADER.itemsize, shape=(count,))
+    addresses = np.memmap(path, dtype="<u8", mode="r", offset=_address_offset(count), shape=(count,))
+    return labels, addresses
+
+
+def iter_addresses(addresses, chunk_size=CHUNK_LINES):
+    # Yield plain Python ints chunk by chunk so dict-based policies hash native ints
+    for start in range(0, len(addresses), chunk_size):
+        yield from addresses[start:start + chunk_size].tolist()
+
+
+if __name__ == "__main__":
+    trace_paths = sys.argv[1:]
+    if not trace_paths:
+        trace_paths = sorted(
+            os.path.join("traces", name)
+            for name in os.listdir("traces")
+            if not name.startswith(".") and not name.endswith(BINARY_SUFFIX)
+        )
+
+    for trace_path in trace_paths:
+        binary_path = convert_trace(trace_path)
+        labels, addresses = load_trace(binary_path)
+        print(f"{trace_path} -> {binary_path} ({len(addresses)} references)")
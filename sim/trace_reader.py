@@ -0,0 +1,54 @@
+import bz2
+import gzip
+import lzma
+from itertools import islice
+
+import numpy as np
+
+CHUNK_SIZE = 1 << 16
+
+_OPENERS = {
+    ".gz": gzip.open,
+    ".xz": lzma.open,
+    ".lzma": lzma.open,
+    ".bz2": bz2.open,
+}
+
+
+def open_trace(path):
+    # Pick a decompressor from the file suffix; plain text otherwise
+    for suffix, opener in _OPENERS.items():
+        if path.endswith(suffix):
+            return opener(path, "rt")
+    return open(path)
+
+
+def parse_chunk(lines):
+    # Parse `<label> <hexaddr>` lines into (uint8 labels, uint64 addresses)
+    tokens = "".join(lines).split()
+    if len(tokens) % 2:
+        raise ValueError("malformed trace chunk: expected '<label> <hexaddr>' on every line")
+    labels = np.array(tokens[0::2], dtype=np.uint8)
+    addresses = np.fromiter((int(token, 16) for token in tokens[1::2]), dtype=np.uint64, count=len(tokens) // 2)
+    return labels, addresses
+
+
+def iter_trace_chunks(path, chunk_size=CHUNK_SIZE):
+    # Yield fixed-size (labels, addresses) arrays; memory use is bounded by chunk_size
+    with open_trace(path) as fp:
+        while True:
+            lines = list(islice(fp, chunk_size))
+            if not lines:
+                break
+            yield parse_chunk(lines)
+
+
+def iter_trace(path, chunk_size=CHUNK_SIZE):
+    # Yield (label, address) pairs as plain Python ints
+    for labels, addresses in iter_trace_chunks(path, chunk_size):
+        yield from zip(labels.tolist(), addresses.tolist())
+
+
+def iter_trace_addresses(path, chunk_size=CHUNK_SIZE):
+    for labels, addresses in iter_trace_chunks(path, chunk_size):
+        yield from addresses.tolist()